@@ -1,10 +1,14 @@
 import os
+import sys
+import argparse
+import multiprocessing
 import tempfile
 import base64
 import urllib.parse
 import shutil
 from main import ppt_to_pdf
 from pdf2md import convert_pdf_to_markdown
+from work_queue import init_queue, enqueue_job, run_worker, queue_status, DEFAULT_LEASE_SECONDS
 
 def decode_filename(filename):
     decoding_attempts = [
@@ -47,6 +51,99 @@ def change_filename(input_folder):
             os.rename(input_path, new_input_path)
             print(f"파일명 변경: {file} -> {new_filename}")
 
+def get_output_paths(root, file, input_folder, output_folder):
+    """
+    입력 파일에 대응하는 PDF/Markdown 출력 경로를 반환하는 함수
+    """
+    filename_without_ext, ext = os.path.splitext(file)
+    relative_path = os.path.relpath(root, input_folder)
+    pdf_output_path = os.path.abspath(os.path.join(output_folder, relative_path, f"{filename_without_ext}.pdf"))
+    md_output_path = os.path.abspath(os.path.join(output_folder, relative_path, f"{filename_without_ext}.md"))
+    return pdf_output_path, md_output_path
+
+def check_lease(lease_lost):
+    """
+    작업 임대를 잃었으면 예외를 발생시키는 함수 (다른 작업자가 같은 작업을 가져갔을 수 있음)
+    """
+    if lease_lost is not None and lease_lost.is_set():
+        raise Exception("작업 임대를 잃어 처리를 중단합니다.")
+
+def convert_file(input_path, pdf_output_path, md_output_path, lease_lost=None):
+    """
+    PPT 파일 하나를 PDF와 Markdown으로 변환하는 함수, 실패 시 예외 발생
+    같은 파일을 다른 작업자가 동시에 쓰더라도 결과가 섞이지 않도록 임시 파일에 쓴 뒤 os.replace로 바꿉니다.
+    """
+    os.makedirs(os.path.dirname(pdf_output_path), exist_ok=True)
+    # 임시 파일 이름은 mkstemp로 만들어 여러 노드의 작업자가 같은 이름을 쓰지 않도록 함
+    fd, temp_pdf_path = tempfile.mkstemp(dir=os.path.dirname(pdf_output_path), suffix=".tmp.pdf")
+    os.close(fd)
+    try:
+        if not ppt_to_pdf(input_path, temp_pdf_path):
+            raise Exception(f"PPT를 PDF로 변환하는데 실패했습니다: {input_path}")
+        check_lease(lease_lost)
+        os.replace(temp_pdf_path, pdf_output_path)
+    finally:
+        if os.path.exists(temp_pdf_path):
+            os.remove(temp_pdf_path)
+
+    md_content = convert_pdf_to_markdown(pdf_output_path, engine="pymupdf", image_mode="passthrough",
+                                         output_root=os.path.dirname(md_output_path))
+    check_lease(lease_lost)
+    fd, temp_md_path = tempfile.mkstemp(dir=os.path.dirname(md_output_path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(md_content)
+        os.replace(temp_md_path, md_output_path)
+    finally:
+        if os.path.exists(temp_md_path):
+            os.remove(temp_md_path)
+    print(f"PDF를 Markdown으로 변환 완료: {md_output_path}")
+
+def process_job(payload, lease_lost=None):
+    """
+    작업 큐에서 가져온 작업을 처리하는 함수
+    lease_lost가 설정되면 다음 단계로 넘어가기 전에 처리를 중단합니다.
+    """
+    if not os.path.exists(payload["input_path"]):
+        raise Exception(f"입력 파일을 찾을 수 없습니다: {payload['input_path']}")
+    convert_file(payload["input_path"], payload["pdf_output_path"], payload["md_output_path"], lease_lost)
+
+def enqueue_files(db_path, input_folder, output_folder):
+    """
+    입력 폴더의 모든 PPT 파일을 공유 작업 큐에 추가하는 함수
+    
+    :param db_path: 공유 마운트에 있는 작업 큐 SQLite 파일 경로
+    :param input_folder: 입력 폴더 경로
+    :param output_folder: 출력 폴더 경로
+    :return: 새로 추가된 작업 수
+    """
+    init_queue(db_path)
+    added = 0
+    for root, dirs, files in os.walk(input_folder):
+        for file in files:
+            if not file.lower().endswith((".ppt", ".pptx")):
+                continue
+            input_path = os.path.abspath(os.path.join(root, file))
+            pdf_output_path, md_output_path = get_output_paths(root, file, input_folder, output_folder)
+            payload = {"input_path": input_path, "pdf_output_path": pdf_output_path, "md_output_path": md_output_path}
+            if enqueue_job(db_path, input_path, payload):
+                added += 1
+    print(f"{added}개의 작업을 큐에 추가했습니다: {db_path}")
+    return added
+
+def run_workers(db_path, worker_count, lease_seconds):
+    """
+    이 노드에서 작업자 프로세스 여러 개를 실행해 큐를 처리하는 함수
+    """
+    processes = [
+        multiprocessing.Process(target=run_worker, args=(db_path, process_job), kwargs={"lease_seconds": lease_seconds})
+        for _ in range(worker_count)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
 def process_files(input_folder, output_folder):
     print(f"입력 폴더: {input_folder}")
     
@@ -54,30 +151,20 @@ def process_files(input_folder, output_folder):
         for file in files:
             if file.lower().endswith((".ppt", ".pptx")):
                 input_path = os.path.abspath(os.path.join(root, file))
-                filename_without_ext, ext = os.path.splitext(file)
-                
-                relative_path = os.path.relpath(root, input_folder)
-                pdf_output_path = os.path.abspath(os.path.join(output_folder, relative_path, f"{filename_without_ext}.pdf"))
-                md_output_path = os.path.abspath(os.path.join(output_folder, relative_path, f"{filename_without_ext}.md"))
-                
-                os.makedirs(os.path.dirname(pdf_output_path), exist_ok=True)
+                pdf_output_path, md_output_path = get_output_paths(root, file, input_folder, output_folder)
                 
                 print(f"PPT 파일 처리 중: {file}")
                 print(f"입력 경로: {input_path}")
                 print(f"PDF 출력 경로: {pdf_output_path}")
+                print(f"Markdown 출력 경로: {md_output_path}")
                 
                 if not os.path.exists(input_path):
                     print(f"오류: 입력 파일을 찾을 수 없습니다: {input_path}")
                     continue
                 
                 try:
-                    ppt_to_pdf(input_path, pdf_output_path)
-                    print(f"{file}을(를) PDF로 변환했습니다.")
-                    
-                    # md_content = convert_pdf_to_markdown(pdf_output_path)
-                    # with open(md_output_path, 'w', encoding='utf-8') as f:
-                    #     f.write(md_content)
-                    # print(f"PDF를 Markdown으로 변환 완료: {md_output_path}")
+                    convert_file(input_path, pdf_output_path, md_output_path)
+                    print(f"{file}을(를) PDF와 Markdown으로 변환했습니다.")
                 except Exception as e:
                     print(f"오류 발생: {file} 처리 중 문제가 발생했습니다.")
                     print(f"오류 메시지: {str(e)}")
@@ -90,7 +177,35 @@ def process_files(input_folder, output_folder):
             sub_output_folder = os.path.join(output_folder, os.path.relpath(sub_input_folder, input_folder))
             process_files(sub_input_folder, sub_output_folder)
 
-input_folder = os.path.abspath("data")
-output_folder = os.path.abspath("/result/data")
-#change_filename(input_folder)
-process_files(input_folder, output_folder)
\ No newline at end of file
+if __name__ == "__main__":
+    # 여러 노드에서 나눠 처리하려면 공유 마운트에 큐를 만들고 노드마다 작업자를 실행합니다.
+    #   python data2md.py enqueue --queue /mnt/shared/queue.db
+    #   python data2md.py worker --queue /mnt/shared/queue.db --workers 2
+    parser = argparse.ArgumentParser(description="PPT 파일 일괄 변환")
+    parser.add_argument("command", nargs="?", default="local", choices=["local", "enqueue", "worker", "status"],
+                        help="local: 이 노드에서 직접 처리, enqueue: 큐에 작업 추가, worker: 큐 처리, status: 큐 상태 확인")
+    parser.add_argument("--input", default="data", help="입력 폴더")
+    parser.add_argument("--output", default="/result/data", help="출력 폴더")
+    parser.add_argument("--queue", help="공유 작업 큐 SQLite 파일 경로")
+    parser.add_argument("--workers", type=int, default=1, help="이 노드에서 실행할 작업자 프로세스 수")
+    parser.add_argument("--lease", type=int, default=DEFAULT_LEASE_SECONDS, help="작업 임대 기간(초)")
+    args = parser.parse_args()
+
+    input_folder = os.path.abspath(args.input)
+    output_folder = os.path.abspath(args.output)
+
+    if args.command == "local":
+        #change_filename(input_folder)
+        process_files(input_folder, output_folder)
+        sys.exit(0)
+
+    if not args.queue:
+        parser.error("--queue 경로가 필요합니다.")
+
+    if args.command == "enqueue":
+        enqueue_files(args.queue, input_folder, output_folder)
+    elif args.command == "worker":
+        init_queue(args.queue)
+        run_workers(args.queue, args.workers, args.lease)
+    elif args.command == "status":
+        print(queue_status(args.queue))
\ No newline at end of file
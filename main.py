@@ -1,8 +1,12 @@
-# pip install comtypes pdf2image Pillow transformers torch pytesseract easyocr reportlab PyMuPDF streamlit
+# pip install comtypes(Windows) pdf2image Pillow transformers torch pytesseract easyocr reportlab PyMuPDF streamlit
 import streamlit as st
 import os
+import json
 import tempfile
-from comtypes import client
+import time
+import shutil
+import pathlib
+import subprocess
 from pdf2image import convert_from_path
 from PIL import Image
 from pdf2image.exceptions import PDFInfoNotInstalledError, PDFPageCountError
@@ -14,16 +18,25 @@ from reportlab.lib.pagesizes import letter
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 import fitz
+import numpy as np
+from pipeline import run_pipeline, write_results_zip, iter_with_deadline
+from pdf2md import iter_pdf_to_markdown
+from parse_ppt import process_pptx
 
 def ppt_to_pdf(ppt_path, pdf_path):
     """
     PPT 파일을 PDF로 변환하는 함수
+    Windows에서는 PowerPoint(COM)를, 그 밖의 OS에서는 LibreOffice를 사용합니다.
     
     :param ppt_path: PPT 파일 경로
     :param pdf_path: 저장할 PDF 파일 경로
     :return: 성공 시 True, 실패 시 False
     """
+    if os.name != "nt":
+        return ppt_to_pdf_libreoffice(ppt_path, pdf_path)
+
     try:
+        from comtypes import client  # COM은 Windows에서만 사용할 수 있음
         powerpoint = client.CreateObject("Powerpoint.Application")
         powerpoint.Visible = 1
         presentation = powerpoint.Presentations.Open(ppt_path)
@@ -37,6 +50,42 @@ def ppt_to_pdf(ppt_path, pdf_path):
         print(f"PPT를 PDF로 변환하는 중 오류 발생: {str(e)}")
         return False
 
+def ppt_to_pdf_libreoffice(ppt_path, pdf_path, timeout=600):
+    """
+    LibreOffice(soffice)를 사용해 PPT 파일을 PDF로 변환하는 함수
+    같은 서버에서 여러 프로세스가 동시에 변환해도 충돌하지 않도록 변환마다 임시 폴더에 별도의 사용자 프로필을 만들고,
+    변환이 끝나면 결과 파일과 함께 삭제합니다.
+    
+    :param ppt_path: PPT 파일 경로
+    :param pdf_path: 저장할 PDF 파일 경로
+    :param timeout: 변환 제한 시간(초)
+    :return: 성공 시 True, 실패 시 False
+    """
+    soffice = shutil.which("soffice") or shutil.which("libreoffice")
+    if soffice is None:
+        print("LibreOffice(soffice)를 찾을 수 없습니다.")
+        return False
+
+    try:
+        with tempfile.TemporaryDirectory() as work_dir:
+            profile_url = pathlib.Path(work_dir, "profile").as_uri()
+            out_dir = os.path.join(work_dir, "out")
+            result = subprocess.run(
+                [soffice, f"-env:UserInstallation={profile_url}", "--headless",
+                 "--convert-to", "pdf", "--outdir", out_dir, os.path.abspath(ppt_path)],
+                capture_output=True, text=True, timeout=timeout
+            )
+            converted_path = os.path.join(out_dir, os.path.splitext(os.path.basename(ppt_path))[0] + ".pdf")
+            if result.returncode != 0 or not os.path.exists(converted_path):
+                raise Exception(f"soffice 종료 코드 {result.returncode}: {result.stderr.strip()}")
+            shutil.move(converted_path, pdf_path)
+
+        print(f"PPT 파일이 {pdf_path}로 변환되었습니다.")
+        return True
+    except Exception as e:
+        print(f"PPT를 PDF로 변환하는 중 오류 발생: {str(e)}")
+        return False
+
 def pdf_to_images(pdf_path, output_folder):
     """
     PDF 파일을 이미지로 변환하는 함수
@@ -86,6 +135,35 @@ def load_ocr_model():
     model = AutoModel.from_pretrained('ucaslcl/GOT-OCR2_0', trust_remote_code=True, low_cpu_mem_usage=True, device_map='cuda', use_safetensors=True, pad_token_id=tokenizer.eos_token_id)
     return tokenizer, model.eval().cuda()
 
+def ocr_images(image_paths, output_folder, reader=None, progress_callback=None):
+    """
+    이미지 리스트에 OCR을 수행하고 결과를 텍스트 파일로 저장하는 함수
+    
+    :param image_paths: OCR을 수행할 이미지 파일 경로 리스트
+    :param output_folder: OCR 결과를 저장할 폴더 경로
+    :param reader: 재사용할 easyocr.Reader, None이면 새로 생성
+    :param progress_callback: progress_callback(완료 수, 전체 수), 이미지마다 호출
+    :return: OCR 결과 텍스트 리스트
+    """
+    if reader is None:
+        reader = easyocr.Reader(['en', 'ko'])
+    ocr_results = []
+    
+    for i, image_path in enumerate(image_paths):
+        res = reader.readtext(image_path, detail=0, paragraph=True)
+        
+        # OCR 결과를 텍스트 파일로 저장
+        txt_path = os.path.join(output_folder, f"ocr_result_{i+1}.txt")
+        with open(txt_path, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(res))
+        
+        ocr_results.append('\n'.join(res))
+        print(f"이미지 {i+1}의 OCR 결과가 {txt_path}에 저장되었습니다.")
+        if progress_callback:
+            progress_callback(i + 1, len(image_paths))
+    
+    return ocr_results
+
 def ppt_to_image_ocr(ppt_path, pdf_path, output_folder):
     """
     PPT를 PDF로 변환하고, 이미지로 변환한 후 OCR을 수행하는 함수
@@ -106,25 +184,40 @@ def ppt_to_image_ocr(ppt_path, pdf_path, output_folder):
             raise Exception("PDF를 이미지로 변환하는데 실패했습니다.")
         
         # OCR 수행
-        reader = easyocr.Reader(['en', 'ko'])
-        ocr_results = []
+        return ocr_images(image_paths, output_folder)
+    except Exception as e:
+        print(f"PPT를 이미지로 변환하고 OCR을 수행하는 중 오류 발생: {str(e)}")
+        return []
+
+def pptx_native_ocr(pptx_path, output_folder, reader=None, progress_callback=None):
+    """
+    PowerPoint 없이 PPTX에서 직접 텍스트를 추출하고 그림 이미지만 OCR하는 함수
+    텍스트, 표, 노트는 문서에서 바로 읽고, 그림 도형의 내장 이미지만 OCR해 슬라이드별 Markdown에 합칩니다.
+    
+    :param pptx_path: PPTX 파일 경로
+    :param output_folder: 슬라이드별 결과를 저장할 폴더 경로
+    :param reader: 재사용할 easyocr.Reader, None이면 새로 생성
+    :param progress_callback: progress_callback(완료 수, 전체 수), 슬라이드마다 호출
+    :return: {슬라이드 번호: Markdown 텍스트} 딕셔너리, 실패 시 빈 딕셔너리
+    """
+    if not os.path.exists(output_folder):
+        os.makedirs(output_folder)
+    
+    try:
+        if reader is None:
+            reader = easyocr.Reader(['en', 'ko'])
+        slides_text = process_pptx(pptx_path, reader, progress_callback)
         
-        for i, image_path in enumerate(image_paths):
-            image = Image.open(image_path)
-            res = reader.readtext(image, detail=0, paragraph=True)
-            
-            # OCR 결과를 텍스트 파일로 저장
-            txt_path = os.path.join(output_folder, f"ocr_result_{i+1}.txt")
+        for slide_num in sorted(slides_text.keys()):
+            txt_path = os.path.join(output_folder, f"ocr_result_{slide_num}.txt")
             with open(txt_path, 'w', encoding='utf-8') as f:
-                f.write('\n'.join(res))
-            
-            ocr_results.append('\n'.join(res))
-            print(f"이미지 {i+1}의 OCR 결과가 {txt_path}에 저장되었습니다.")
+                f.write(slides_text[slide_num])
         
-        return ocr_results
+        print(f"{len(slides_text)}개 슬라이드의 결과가 {output_folder}에 저장되었습니다.")
+        return slides_text
     except Exception as e:
-        print(f"PPT를 이미지로 변환하고 OCR을 수행하는 중 오류 발생: {str(e)}")
-        return []
+        print(f"PPTX 텍스트 추출 및 이미지 OCR 수행 중 오류 발생: {str(e)}")
+        return {}
 
 def pdf_to_image_ocr(pdf_path, output_folder):
     """
@@ -141,24 +234,253 @@ def pdf_to_image_ocr(pdf_path, output_folder):
             raise Exception("PDF를 이미지로 변환하는데 실패했습니다.")
         
         # OCR 수행
+        return ocr_images(image_paths, output_folder)
+    except Exception as e:
+        print(f"PDF를 이미지로 변환하고 OCR을 수행하는 중 오류 발생: {str(e)}")
+        return []
+
+def iter_pdf_image_ocr(pdf_path, output_folder, time_budget=None, reader=None, dpi=200):
+    """
+    PDF를 페이지 단위로 렌더링하고 OCR해 결과를 완료되는 대로 내보내는 함수
+    첫 페이지부터 순서대로 처리하며, 시간 예산이 다 되면 남은 페이지를 "pending"으로 내보내고 멈춥니다.
+    페이지 하나의 오류는 해당 페이지만 "error"로 기록합니다.
+    
+    :param pdf_path: PDF 파일 경로
+    :param output_folder: 이미지와 OCR 결과를 저장할 폴더 경로
+    :param time_budget: 시간 예산(초), None이면 제한 없음
+    :param reader: 재사용할 easyocr.Reader, None이면 새로 생성
+    :param dpi: 렌더링 해상도
+    :return: 페이지별 결과 딕셔너리 제너레이터 (pipeline.iter_with_deadline 참고), result는 OCR 텍스트
+    """
+    if not os.path.exists(output_folder):
+        os.makedirs(output_folder)
+    if reader is None:
         reader = easyocr.Reader(['en', 'ko'])
-        ocr_results = []
-        
-        for i, image_path in enumerate(image_paths):
+
+    with fitz.open(pdf_path) as doc:
+        def ocr_page(page_num):
+            image_path = os.path.join(output_folder, f"page_{page_num}.png")
+            doc[page_num - 1].get_pixmap(dpi=dpi).save(image_path)
             res = reader.readtext(image_path, detail=0, paragraph=True)
             
             # OCR 결과를 텍스트 파일로 저장
-            txt_path = os.path.join(output_folder, f"ocr_result_{i+1}.txt")
+            txt_path = os.path.join(output_folder, f"ocr_result_{page_num}.txt")
             with open(txt_path, 'w', encoding='utf-8') as f:
                 f.write('\n'.join(res))
-            
-            ocr_results.append('\n'.join(res))
-            print(f"이미지 {i+1}의 OCR 결과가 {txt_path}에 저장되었습니다.")
-        
-        return ocr_results
-    except Exception as e:
-        print(f"PDF를 이미지로 변환하고 OCR을 수행하는 중 오류 발생: {str(e)}")
-        return []
+            return '\n'.join(res)
+
+        yield from iter_with_deadline(list(range(1, len(doc) + 1)), ocr_page, time_budget)
+
+def render_page_gray(page, dpi, clip=None):
+    """
+    PDF 페이지(또는 일부 영역)를 흑백 numpy 배열로 렌더링하는 함수
+    
+    :param page: fitz.Page 객체
+    :param dpi: 렌더링 해상도
+    :param clip: 렌더링할 영역 (PDF 좌표), None이면 페이지 전체
+    :return: (높이, 너비) uint8 배열
+    """
+    pix = page.get_pixmap(dpi=dpi, clip=clip, colorspace=fitz.csGRAY, alpha=False)
+    return np.frombuffer(pix.samples, dtype=np.uint8).reshape(pix.height, pix.width)
+
+def ocr_page_region(reader, page, dpi, clip=None):
+    """
+    PDF 페이지 영역을 렌더링하고 OCR을 수행해 PDF 좌표로 변환된 결과를 반환하는 함수
+    
+    :return: 인식 결과 딕셔너리 리스트 (rect, text, confidence, dpi)
+    """
+    origin_x, origin_y = (clip.x0, clip.y0) if clip is not None else (0, 0)
+    scale = 72 / dpi
+    items = []
+    for bbox, text, confidence in reader.readtext(render_page_gray(page, dpi, clip), detail=1):
+        xs = [point[0] for point in bbox]
+        ys = [point[1] for point in bbox]
+        rect = fitz.Rect(origin_x + min(xs) * scale, origin_y + min(ys) * scale,
+                         origin_x + max(xs) * scale, origin_y + max(ys) * scale)
+        items.append({"rect": rect, "text": text, "confidence": float(confidence), "dpi": dpi})
+    return items
+
+def merge_rects(rects, margin):
+    """
+    여백을 더한 사각형 중 겹치는 것들을 합쳐 재인식할 영역 리스트를 만드는 함수
+    """
+    merged = []
+    for rect in rects:
+        rect = fitz.Rect(rect.x0 - margin, rect.y0 - margin, rect.x1 + margin, rect.y1 + margin)
+        changed = True
+        while changed:
+            changed = False
+            for other in merged:
+                if rect.intersects(other):
+                    merged.remove(other)
+                    rect = rect | other
+                    changed = True
+                    break
+        merged.append(rect)
+    return merged
+
+def items_to_text(items):
+    """
+    OCR 결과를 위치 순서대로 줄 단위 텍스트로 합치는 함수
+    """
+    lines = []
+    for item in sorted(items, key=lambda item: ((item["rect"].y0 + item["rect"].y1) / 2, item["rect"].x0)):
+        center_y = (item["rect"].y0 + item["rect"].y1) / 2
+        # 세로 중심이 이전 줄 높이의 절반 이내면 같은 줄로 간주
+        if lines and abs(center_y - lines[-1]["center_y"]) <= lines[-1]["height"] / 2:
+            lines[-1]["items"].append(item)
+        else:
+            lines.append({"center_y": center_y, "height": item["rect"].height, "items": [item]})
+    return '\n'.join(' '.join(item["text"] for item in sorted(line["items"], key=lambda item: item["rect"].x0)) for line in lines)
+
+def new_adaptive_ocr_stats(low_dpi, high_dpi):
+    """
+    적응형 OCR 문서 통계 딕셔너리를 만드는 함수
+    """
+    return {
+        "pages": 0, "reocr_pages": 0, "reocr_regions": 0, "regions": 0,
+        "dpi_mix": {str(low_dpi): 0, str(high_dpi): 0},
+        "confidence_mix": {"high": 0, "medium": 0, "low": 0},
+        "mean_confidence": 0.0, "seconds": 0.0,
+    }
+
+def adaptive_ocr_page(reader, page, page_num, output_folder, stats, low_dpi=100, high_dpi=300,
+                      confidence_threshold=0.6):
+    """
+    PDF 페이지 하나를 적응형 해상도로 OCR하고 결과를 저장하는 함수
+    페이지를 낮은 해상도로 먼저 인식하고, 신뢰도가 기준보다 낮은 영역만 높은 해상도로 다시 인식합니다.
+    
+    :param reader: easyocr.Reader
+    :param page: fitz.Page 객체
+    :param page_num: 페이지 번호 (결과 파일 이름에 사용)
+    :param output_folder: OCR 결과를 저장할 폴더 경로
+    :param stats: new_adaptive_ocr_stats로 만든 문서 통계, 페이지 처리가 끝나면 누적
+    :return: 페이지 OCR 결과 텍스트
+    """
+    items = ocr_page_region(reader, page, low_dpi)
+    low_items = [item for item in items if item["confidence"] < confidence_threshold]
+
+    # 신뢰도가 낮은 영역만 높은 해상도로 재인식
+    regions = merge_rects([item["rect"] for item in low_items], margin=4) if low_items else []
+    for region in regions:
+        region = region & page.rect
+        if region.is_empty:
+            continue
+        # 이 영역을 만든 저신뢰도 상자만 교체 대상으로 하고, 재인식 결과 중 중심이 그 상자들 안에 있는 것만 사용
+        # (영역에 일부만 걸친 이웃 상자의 글자가 중복되지 않도록)
+        old_items = [item for item in low_items if region.intersects(item["rect"])]
+        old_ids = {id(item) for item in old_items}
+        new_items = [
+            item for item in ocr_page_region(reader, page, high_dpi, clip=region)
+            if any(old["rect"].contains((item["rect"].tl + item["rect"].br) / 2) for old in old_items)
+        ]
+        old_confidence = sum(item["confidence"] for item in old_items) / max(len(old_items), 1)
+        new_confidence = sum(item["confidence"] for item in new_items) / max(len(new_items), 1)
+        # 재인식 결과가 더 나을 때만 교체
+        if new_items and new_confidence >= old_confidence:
+            items = [item for item in items if id(item) not in old_ids] + new_items
+
+    text = items_to_text(items)
+    txt_path = os.path.join(output_folder, f"ocr_result_{page_num}.txt")
+    with open(txt_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    print(f"페이지 {page_num}의 OCR 결과가 {txt_path}에 저장되었습니다. (재인식 영역 {len(regions)}개)")
+
+    # 페이지 처리가 끝난 뒤에 통계를 누적해 실패한 페이지가 섞이지 않도록 함
+    if regions:
+        stats["reocr_pages"] += 1
+        stats["reocr_regions"] += len(regions)
+    for item in items:
+        stats["dpi_mix"][str(item["dpi"])] += 1
+        if item["confidence"] >= 0.9:
+            stats["confidence_mix"]["high"] += 1
+        elif item["confidence"] >= confidence_threshold:
+            stats["confidence_mix"]["medium"] += 1
+        else:
+            stats["confidence_mix"]["low"] += 1
+        stats["regions"] += 1
+        stats["mean_confidence"] += (item["confidence"] - stats["mean_confidence"]) / stats["regions"]
+    stats["pages"] += 1
+    return text
+
+def write_adaptive_ocr_stats(stats, output_folder, start_time):
+    """
+    적응형 OCR 문서 통계를 ocr_stats.json으로 저장하는 함수
+    
+    :return: 저장된 파일 경로
+    """
+    stats["seconds"] = time.perf_counter() - start_time
+    stats_path = os.path.join(output_folder, "ocr_stats.json")
+    with open(stats_path, 'w', encoding='utf-8') as f:
+        json.dump(stats, f, ensure_ascii=False, indent=2)
+    print(f"적응형 OCR 완료: {stats['pages']}페이지 중 {stats['reocr_pages']}페이지 재인식, "
+          f"DPI 분포 {stats['dpi_mix']}, 신뢰도 분포 {stats['confidence_mix']}, "
+          f"평균 신뢰도 {stats['mean_confidence']:.2f}, {stats['seconds']:.1f}초")
+    return stats_path
+
+def adaptive_pdf_ocr(pdf_path, output_folder, reader=None, low_dpi=100, high_dpi=300,
+                     confidence_threshold=0.6, progress_callback=None):
+    """
+    적응형 해상도로 PDF OCR을 수행하는 함수
+    모든 페이지를 낮은 해상도로 먼저 인식하고, 신뢰도가 기준보다 낮은 영역만
+    높은 해상도로 다시 렌더링해 인식한 뒤 결과를 합칩니다.
+    
+    :param pdf_path: PDF 파일 경로
+    :param output_folder: OCR 결과를 저장할 폴더 경로
+    :param reader: 재사용할 easyocr.Reader, None이면 새로 생성
+    :param low_dpi: 1차 인식 해상도
+    :param high_dpi: 재인식 해상도
+    :param confidence_threshold: 이 값보다 신뢰도가 낮은 영역을 재인식
+    :param progress_callback: progress_callback(완료 수, 전체 수), 페이지마다 호출
+    :return: (페이지별 OCR 결과 텍스트 리스트, 문서 통계 딕셔너리)
+    """
+    if not os.path.exists(output_folder):
+        os.makedirs(output_folder)
+    if reader is None:
+        reader = easyocr.Reader(['en', 'ko'])
+
+    stats = new_adaptive_ocr_stats(low_dpi, high_dpi)
+    start_time = time.perf_counter()
+    ocr_results = []
+
+    with fitz.open(pdf_path) as doc:
+        for page_num, page in enumerate(doc, start=1):
+            ocr_results.append(adaptive_ocr_page(reader, page, page_num, output_folder, stats,
+                                                 low_dpi, high_dpi, confidence_threshold))
+            if progress_callback:
+                progress_callback(page_num, len(doc))
+
+    write_adaptive_ocr_stats(stats, output_folder, start_time)
+    return ocr_results, stats
+
+def iter_adaptive_pdf_ocr(pdf_path, output_folder, time_budget=None, reader=None, low_dpi=100, high_dpi=300,
+                          confidence_threshold=0.6):
+    """
+    적응형 해상도 OCR을 페이지 단위로 수행해 결과를 완료되는 대로 내보내는 함수
+    시간 예산이 다 되면 남은 페이지를 "pending"으로 내보내고 멈추며, 처리를 마치면 처리한 페이지의 통계를 ocr_stats.json으로 저장합니다.
+    
+    :param pdf_path: PDF 파일 경로
+    :param output_folder: OCR 결과를 저장할 폴더 경로
+    :param time_budget: 시간 예산(초), None이면 제한 없음
+    :param reader: 재사용할 easyocr.Reader, None이면 새로 생성
+    :return: 페이지별 결과 딕셔너리 제너레이터 (pipeline.iter_with_deadline 참고), result는 OCR 텍스트
+    """
+    if not os.path.exists(output_folder):
+        os.makedirs(output_folder)
+    if reader is None:
+        reader = easyocr.Reader(['en', 'ko'])
+
+    stats = new_adaptive_ocr_stats(low_dpi, high_dpi)
+    start_time = time.perf_counter()
+
+    with fitz.open(pdf_path) as doc:
+        def ocr_page(page_num):
+            return adaptive_ocr_page(reader, doc[page_num - 1], page_num, output_folder, stats,
+                                     low_dpi, high_dpi, confidence_threshold)
+
+        yield from iter_with_deadline(list(range(1, len(doc) + 1)), ocr_page, time_budget)
+
+    write_adaptive_ocr_stats(stats, output_folder, start_time)
 
 def txt_to_pdf_convert(txt_files_path, pdf_file_name):
     """
@@ -231,185 +553,576 @@ def pdf_to_html(pdf_path, html_path):
         print(f"PDF를 HTML로 변환하는 중 오류 발생: {str(e)}")
         return False
 
-def extract_image_from_pdf(pdf_path, output_folder):
+def extract_page_images(doc, page_num, output_folder):
     """
-    PDF 파일에서 이미지를 추출하고 OCR을 수행하는 함수
+    PDF 페이지 하나에 포함된 이미지를 원본 형식 그대로 저장하는 함수
+    
+    :param doc: fitz.Document 객체
+    :param page_num: 페이지 번호 (1부터 시작)
+    :param output_folder: 이미지를 저장할 폴더 경로
+    :return: (페이지 번호, 이미지 번호, 이미지 경로) 튜플 리스트
+    """
+    extracted = []
+    for img_index, img in enumerate(doc[page_num - 1].get_images()):
+        xref = img[0]
+        base_image = doc.extract_image(xref)
+        image_bytes = base_image["image"]
+        image_ext = base_image["ext"]
+        image_path = os.path.join(output_folder, f"image_{page_num}_{img_index+1}.{image_ext}")
+        
+        with open(image_path, "wb") as image_file:
+            image_file.write(image_bytes)
+        
+        extracted.append((page_num, img_index + 1, image_path))
+    return extracted
+
+def extract_images(pdf_path, output_folder):
+    """
+    PDF 파일에 포함된 이미지를 원본 형식 그대로 저장하는 함수
     
     :param pdf_path: PDF 파일 경로
-    :param output_folder: 이미지와 OCR 결과를 저장할 폴더 경로
-    :return: 추출된 이미지 수, 실패 시 0
+    :param output_folder: 이미지를 저장할 폴더 경로
+    :return: (페이지 번호, 이미지 번호, 이미지 경로) 튜플 리스트
     """
     if not os.path.exists(output_folder):
         os.makedirs(output_folder)
     
-    try:
-        doc = fitz.open(pdf_path)
-        image_count = 0
+    extracted = []
+    with fitz.open(pdf_path) as doc:
+        for page_num in range(1, len(doc) + 1):
+            extracted.extend(extract_page_images(doc, page_num, output_folder))
+
+    return extracted
+
+def ocr_extracted_images(extracted, output_folder, reader=None, progress_callback=None):
+    """
+    extract_images로 추출한 이미지에 OCR을 수행하는 함수
+    
+    :param extracted: extract_images의 반환값
+    :param output_folder: OCR 결과를 저장할 폴더 경로
+    :param reader: 재사용할 easyocr.Reader, None이면 새로 생성
+    :param progress_callback: progress_callback(완료 수, 전체 수), 이미지마다 호출
+    :return: 저장된 OCR 결과 파일 경로 리스트
+    """
+    if reader is None:
         reader = easyocr.Reader(['en', 'ko'])
+    text_paths = []
 
-        for page_num in range(len(doc)):
-            page = doc[page_num]
-            images = page.get_images()
-            for img_index, img in enumerate(images):
-                xref = img[0]
-                base_image = doc.extract_image(xref)
-                image_bytes = base_image["image"]
-                image_ext = base_image["ext"]
-                image_path = os.path.join(output_folder, f"image_{page_num+1}_{img_index+1}.{image_ext}")
-                
-                with open(image_path, "wb") as image_file:
-                    image_file.write(image_bytes)
-                
-                # OCR 수행
-                res = reader.readtext(image_path, detail=0, paragraph=True)
-                
-                # OCR 결과를 텍스트 파일로 저장
-                text_path = os.path.join(output_folder, f"ocr_text_{page_num+1}_{img_index+1}.txt")
-                with open(text_path, 'w', encoding='utf-8') as f:
-                    f.write('\n'.join(res))
-                
-                image_count += 1
+    for i, (page_num, img_index, image_path) in enumerate(extracted):
+        res = reader.readtext(image_path, detail=0, paragraph=True)
         
-        print(f"{image_count}개의 이미지가 추출되고 OCR이 수행되었습니다.")
-        return image_count
+        # OCR 결과를 텍스트 파일로 저장
+        text_path = os.path.join(output_folder, f"ocr_text_{page_num}_{img_index}.txt")
+        with open(text_path, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(res))
+        
+        text_paths.append(text_path)
+        if progress_callback:
+            progress_callback(i + 1, len(extracted))
+
+    return text_paths
+
+def iter_extract_images(pdf_path, output_folder, time_budget=None, reader=None):
+    """
+    PDF에서 페이지 단위로 이미지를 추출하고 OCR해 결과를 완료되는 대로 내보내는 함수
+    
+    :param pdf_path: PDF 파일 경로
+    :param output_folder: 이미지와 OCR 결과를 저장할 폴더 경로
+    :param time_budget: 시간 예산(초), None이면 제한 없음
+    :param reader: 재사용할 easyocr.Reader, None이면 새로 생성
+    :return: 페이지별 결과 딕셔너리 제너레이터 (pipeline.iter_with_deadline 참고),
+             result는 (이미지 경로, OCR 결과 파일 경로) 튜플 리스트
+    """
+    if not os.path.exists(output_folder):
+        os.makedirs(output_folder)
+    if reader is None:
+        reader = easyocr.Reader(['en', 'ko'])
+
+    with fitz.open(pdf_path) as doc:
+        def extract_page(page_num):
+            extracted = extract_page_images(doc, page_num, output_folder)
+            text_paths = ocr_extracted_images(extracted, output_folder, reader)
+            return [(image_path, text_path) for (_, _, image_path), text_path in zip(extracted, text_paths)]
+
+        yield from iter_with_deadline(list(range(1, len(doc) + 1)), extract_page, time_budget)
+
+def extract_image_from_pdf(pdf_path, output_folder):
+    """
+    PDF 파일에서 이미지를 추출하고 OCR을 수행하는 함수
+    
+    :param pdf_path: PDF 파일 경로
+    :param output_folder: 이미지와 OCR 결과를 저장할 폴더 경로
+    :return: 추출된 이미지 수, 실패 시 0
+    """
+    try:
+        extracted = extract_images(pdf_path, output_folder)
+        ocr_extracted_images(extracted, output_folder)
+        
+        print(f"{len(extracted)}개의 이미지가 추출되고 OCR이 수행되었습니다.")
+        return len(extracted)
     except Exception as e:
         print(f"PDF에서 이미지 추출 및 OCR 수행 중 오류 발생: {str(e)}")
         return 0
 
+@st.cache_resource
+def get_ocr_reader():
+    """
+    Streamlit 실행 간에 재사용할 OCR 리더를 로드하는 함수
+    """
+    return easyocr.Reader(['en', 'ko'])
+
+def save_uploaded_file(uploaded_file, suffix=None):
+    """
+    업로드된 파일을 임시 파일로 저장하는 함수
+    
+    :param uploaded_file: st.file_uploader로 업로드된 파일
+    :param suffix: 임시 파일 확장자, None이면 원본 확장자 사용
+    :return: 저장된 임시 파일 경로
+    """
+    if suffix is None:
+        suffix = os.path.splitext(uploaded_file.name)[1]
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as temp_file:
+        temp_file.write(uploaded_file.getvalue())
+        return temp_file.name
+
+def to_zip_entries(paths, folder_name):
+    """
+    결과 파일 경로 리스트를 (파일 경로, ZIP 내 경로) 리스트로 변환하는 함수
+    """
+    return [(path, f"{folder_name}/{os.path.basename(path)}") for path in paths]
+
+def show_batch_result(folder_name, result):
+    """
+    파일 하나의 일괄 처리 결과를 화면에 표시하는 함수
+    """
+    if result["error"]:
+        st.error(f"{folder_name}: 처리 실패 - {result['error']}")
+        return
+
+    with st.expander(f"{folder_name} ({len(result['outputs'])}개 결과, {result['elapsed']:.1f}초)"):
+        for path, arcname in result["outputs"]:
+            if path.lower().endswith(('.png', '.jpg', '.jpeg')):
+                st.image(Image.open(path), caption=arcname)
+            elif path.lower().endswith('.txt'):
+                with open(path, 'r', encoding='utf-8') as f:
+                    st.text_area(f"OCR 결과 - {arcname}", f.read(), height=200)
+            elif path.lower().endswith('.md'):
+                with open(path, 'r', encoding='utf-8') as f:
+                    st.markdown(f.read())
+            elif path.lower().endswith('.json'):
+                with open(path, 'r', encoding='utf-8') as f:
+                    st.json(json.load(f))
+            else:
+                st.write(arcname)
+
+def stream_page_results(results, live, render, report=None, total=None):
+    """
+    페이지별 결과를 완료되는 대로 화면에 표시하고 처리 현황을 요약하는 함수
+    
+    :param results: 페이지별 결과 딕셔너리 제너레이터 (pipeline.iter_with_deadline 형식)
+    :param live: 결과를 표시할 Streamlit 컨테이너
+    :param render: render(page_num, result), 완료된 페이지를 표시하는 함수
+    :param report: report(완료 수, 전체 수), 페이지마다 호출
+    :param total: 전체 페이지 수
+    :return: {"done": [페이지 번호], "failed": {페이지 번호: 오류 메시지}, "pending": [페이지 번호]}
+    """
+    summary = {"done": [], "failed": {}, "pending": []}
+    with live:
+        for item in results:
+            if item["status"] == "done":
+                render(item["key"], item["result"])
+                summary["done"].append(item["key"])
+            elif item["status"] == "error":
+                st.error(f"페이지 {item['key']} 처리 실패: {item['error']}")
+                summary["failed"][item["key"]] = item["error"]
+            else:
+                summary["pending"].append(item["key"])
+            if report and total and item["status"] != "pending":
+                report(len(summary["done"]) + len(summary["failed"]), total)
+        if summary["pending"]:
+            st.warning(f"시간 예산 안에 처리하지 못한 페이지: {', '.join(map(str, summary['pending']))}")
+    return summary
+
+def write_deadline_report(summary, output_folder):
+    """
+    페이지별 처리 현황(완료/실패/미처리)을 JSON 파일로 저장하는 함수
+    
+    :return: 저장된 파일 경로
+    """
+    report_path = os.path.join(output_folder, "deadline_report.json")
+    with open(report_path, 'w', encoding='utf-8') as f:
+        json.dump(summary, f, ensure_ascii=False, indent=2)
+    return report_path
+
+def get_time_budget(deadline):
+    """
+    일괄 처리 마감 시각까지 남은 시간(초)을 반환하는 함수, 마감 시각이 없으면 None
+    """
+    if deadline is None:
+        return None
+    return max(deadline - time.monotonic(), 0.0)
+
+def run_batch(uploaded_files, prepare, process, zip_name):
+    """
+    업로드된 여러 파일을 파이프라인으로 일괄 처리하는 함수
+    다음 파일의 준비 단계(파싱/렌더링)를 현재 파일의 처리 단계(OCR 등)와 겹쳐 수행하고,
+    파일별/전체 진행률과 처리량을 표시한 뒤 전체 결과를 ZIP으로 제공합니다.
+    
+    :param uploaded_files: st.file_uploader로 업로드된 파일 리스트
+    :param prepare: prepare(item) -> 준비 결과, item은 (결과 폴더명, 업로드 파일)
+    :param process: process(item, prepared, report, live) -> [(파일 경로, ZIP 내 경로), ...]
+                    live는 처리 중인 결과를 바로 표시할 수 있는 컨테이너로, 완료 후 최종 결과로 교체됨
+    :param zip_name: 다운로드할 ZIP 파일 이름
+    """
+    # 같은 이름의 파일이 여러 개 업로드되어도 결과 폴더가 겹치지 않도록 처리
+    items = []
+    used_names = set()
+    for uploaded_file in uploaded_files:
+        base_name = os.path.splitext(uploaded_file.name)[0]
+        folder_name = base_name
+        suffix = 2
+        while folder_name in used_names:
+            folder_name = f"{base_name}_{suffix}"
+            suffix += 1
+        used_names.add(folder_name)
+        items.append((folder_name, uploaded_file))
+
+    total = len(items)
+    overall_bar = st.progress(0.0, text=f"전체 진행률: 0/{total}")
+    file_bar = st.progress(0.0, text="대기 중...")
+    throughput = st.empty()
+    result_area = st.container()
+    state = {"name": "", "file_pages": 0, "pages": 0, "live": None, "live_index": None, "throughput": ""}
+    start_time = time.perf_counter()
+
+    def report(done, count):
+        state["file_pages"] = done
+        file_bar.progress(done / count if count else 1.0, text=f"{state['name']}: {done}/{count} 페이지")
+
+    def on_start(index, item):
+        state["name"] = item[0]
+        state["file_pages"] = 0
+        file_bar.progress(0.0, text=f"{item[0]} 처리 중... ({index+1}/{total})")
+        state["live"] = result_area.empty()
+        state["live_index"] = index
+
+    def on_done(index, result):
+        # 준비 단계에서 실패하면 on_start가 호출되지 않으므로 여기서 파일별 페이지 수를 초기화
+        state["pages"] += state["file_pages"]
+        state["file_pages"] = 0
+        elapsed = time.perf_counter() - start_time
+        overall_bar.progress((index + 1) / total, text=f"전체 진행률: {index+1}/{total}")
+        file_bar.progress(1.0, text=f"{result['item'][0]} 완료 ({result['elapsed']:.1f}초)")
+        summary = f"경과 시간: {elapsed:.1f}초 | 처리량: {(index + 1) / elapsed:.2f} 파일/초"
+        if state["pages"]:
+            summary += f", {state['pages'] / elapsed:.2f} 페이지/초"
+        throughput.write(summary)
+        state["throughput"] = summary
+        # 준비 단계에서 실패해 처리 단계가 시작되지 않은 파일은 새 자리에 표시
+        placeholder = state["live"] if state["live_index"] == index else result_area.empty()
+        with placeholder.container():
+            show_batch_result(result["item"][0], result)
+
+    results = run_pipeline(
+        items,
+        prepare,
+        lambda item, prepared: process(item, prepared, report, state["live"].container()),
+        on_start=on_start,
+        on_done=on_done,
+    )
+
+    zip_path = os.path.join(tempfile.mkdtemp(), zip_name)
+    batch = {
+        "key": get_batch_key(uploaded_files, zip_name),
+        "results": results,
+        "throughput": state["throughput"],
+        "zip_path": zip_path if write_results_zip(results, zip_path) else None,
+        "zip_name": zip_name,
+    }
+    # 다운로드 버튼을 누르면 스크립트가 다시 실행되므로 결과를 세션에 보관
+    st.session_state["last_batch"] = batch
+    show_batch_summary(batch)
+
+def get_batch_key(uploaded_files, zip_name):
+    """
+    일괄 처리 결과를 구분하는 키를 반환하는 함수 (기능별 ZIP 이름과 업로드 파일 목록)
+    """
+    return (zip_name, tuple((uploaded_file.name, uploaded_file.size) for uploaded_file in uploaded_files or []))
+
+def show_batch_summary(batch):
+    """
+    일괄 처리 결과 요약(실패 목록)과 전체 결과 ZIP 다운로드 버튼을 표시하는 함수
+    """
+    failed = [result["item"][0] for result in batch["results"] if result["error"]]
+    if failed:
+        st.warning(f"{len(failed)}개 파일 처리 실패: {', '.join(failed)}")
+    else:
+        st.success(f"{len(batch['results'])}개 파일 처리가 완료되었습니다.")
+
+    if batch["zip_path"]:
+        with open(batch["zip_path"], "rb") as file:
+            st.download_button(
+                label="전체 결과 ZIP 다운로드",
+                data=file,
+                file_name=batch["zip_name"],
+                mime="application/zip"
+            )
+
+def show_last_batch(uploaded_files, zip_name):
+    """
+    같은 기능, 같은 업로드 파일로 마지막에 실행한 일괄 처리 결과를 다시 표시하는 함수
+    """
+    batch = st.session_state.get("last_batch")
+    if not batch or batch["key"] != get_batch_key(uploaded_files, zip_name):
+        return
+    if batch["throughput"]:
+        st.write(batch["throughput"])
+    for result in batch["results"]:
+        show_batch_result(result["item"][0], result)
+    show_batch_summary(batch)
+
 def main():
     st.title("파일 파서 애플리케이션")
 
-    menu = ["PPT to PDF", "PDF to Images", "Image Analysis", "OCR", "TXT to PDF", "PDF to HTML", "Extract Images from PDF"]
+    menu = ["PPT to PDF", "PDF to Images", "Image Analysis", "OCR", "TXT to PDF", "PDF to HTML", "PDF to Markdown", "Extract Images from PDF"]
     choice = st.sidebar.selectbox("기능 선택", menu)
 
     if choice == "PPT to PDF":
         st.subheader("PPT를 PDF로 변환")
-        uploaded_file = st.file_uploader("PPT 파일을 업로드하세요", type=["ppt", "pptx"])
-        if uploaded_file:
-            with st.spinner("PPT를 PDF로 변환 중..."):
-                with tempfile.NamedTemporaryFile(delete=False, suffix=".pptx") as temp_file:
-                    temp_file.write(uploaded_file.read())
-                    temp_file_path = temp_file.name
-                
-                output_pdf = tempfile.NamedTemporaryFile(delete=False, suffix=".pdf").name
-                ppt_to_pdf(temp_file_path, output_pdf)
-                st.success(f"PDF로 변환되었습니다: {output_pdf}")
-                
-                with open(output_pdf, "rb") as file:
-                    st.download_button(
-                        label="변환된 PDF 다운로드",
-                        data=file,
-                        file_name="converted.pdf",
-                        mime="application/pdf"
-                    )
+        uploaded_files = st.file_uploader("PPT 파일을 업로드하세요", type=["ppt", "pptx"], accept_multiple_files=True)
+        if uploaded_files and st.button("일괄 처리 시작"):
+            def prepare(item):
+                return save_uploaded_file(item[1])
+
+            def process(item, temp_file_path, report, live):
+                # PowerPoint COM 자동화는 메인 스레드에서 수행
+                output_pdf = os.path.join(tempfile.mkdtemp(), f"{item[0]}.pdf")
+                if not ppt_to_pdf(temp_file_path, output_pdf):
+                    raise Exception("PPT를 PDF로 변환하는데 실패했습니다.")
+                return [(output_pdf, f"{item[0]}.pdf")]
+
+            run_batch(uploaded_files, prepare, process, "converted_pdf.zip")
+        else:
+            show_last_batch(uploaded_files, "converted_pdf.zip")
 
     elif choice == "PDF to Images":
         st.subheader("PDF를 이미지로 변환")
-        uploaded_file = st.file_uploader("PDF 파일을 업로드하세요", type=["pdf"])
-        if uploaded_file:
-            with st.spinner("PDF를 이미지로 변환 중..."):
-                with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as temp_file:
-                    temp_file.write(uploaded_file.read())
-                    temp_file_path = temp_file.name
-                
-                output_folder = tempfile.mkdtemp()
-                image_paths = pdf_to_images(temp_file_path, output_folder)
-                
-                for image_path in image_paths:
-                    st.image(Image.open(image_path), caption=os.path.basename(image_path))
+        uploaded_files = st.file_uploader("PDF 파일을 업로드하세요", type=["pdf"], accept_multiple_files=True)
+        if uploaded_files and st.button("일괄 처리 시작"):
+            def prepare(item):
+                temp_file_path = save_uploaded_file(item[1], ".pdf")
+                image_paths = pdf_to_images(temp_file_path, tempfile.mkdtemp())
+                if not image_paths:
+                    raise Exception("PDF를 이미지로 변환하는데 실패했습니다.")
+                return image_paths
+
+            def process(item, image_paths, report, live):
+                report(len(image_paths), len(image_paths))
+                return to_zip_entries(image_paths, item[0])
+
+            run_batch(uploaded_files, prepare, process, "images.zip")
+        else:
+            show_last_batch(uploaded_files, "images.zip")
 
     elif choice == "OCR":
         st.subheader("OCR 수행")
-        uploaded_file = st.file_uploader("PDF 또는 이미지 파일을 업로드하세요", type=["pdf", "png", "jpg", "jpeg"])
-        if uploaded_file:
-            # 업로드된 파일 표시
-            if uploaded_file.type.startswith('image'):
-                st.image(uploaded_file, caption="업로드된 이미지", use_column_width=True)
-            elif uploaded_file.type == "application/pdf":
-                st.write("PDF 파일이 업로드되었습니다.")
-                st.write(f"파일명: {uploaded_file.name}")
-            else:
-                st.write(f"업로드된 파일: {uploaded_file.name}")
-            with st.spinner("OCR 수행 중..."):
-                with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(uploaded_file.name)[1]) as temp_file:
-                    temp_file.write(uploaded_file.read())
-                    temp_file_path = temp_file.name
-                
+        uploaded_files = st.file_uploader("PDF, PPTX 또는 이미지 파일을 업로드하세요", type=["pdf", "pptx", "png", "jpg", "jpeg"], accept_multiple_files=True)
+        adaptive = st.checkbox("적응형 해상도 OCR (PDF: 저해상도로 먼저 인식하고 신뢰도가 낮은 영역만 고해상도로 재인식)")
+        if adaptive:
+            confidence_threshold = st.slider("재인식 신뢰도 기준", 0.0, 1.0, 0.6, 0.05)
+        time_budget = st.number_input("시간 예산(초, 0이면 제한 없음) - PDF를 페이지 단위로 처리해 완료되는 대로 표시", min_value=0, value=0, step=5)
+        if time_budget:
+            st.caption("PDF는 페이지 단위로 시간 예산을 적용합니다. PPTX와 이미지 파일은 파일 단위로 적용되어, 시간 예산이 다 된 뒤의 파일은 처리하지 않습니다.")
+        if uploaded_files and st.button("일괄 처리 시작"):
+            reader = get_ocr_reader()
+            deadline = time.monotonic() + time_budget if time_budget else None
+
+            def prepare(item):
+                # 렌더링은 백그라운드에서 수행되어 이전 파일의 OCR과 겹쳐 진행됨
+                temp_file_path = save_uploaded_file(item[1])
                 output_folder = tempfile.mkdtemp()
-                if uploaded_file.type == "application/pdf":
-                    pdf_to_image_ocr(temp_file_path, output_folder)
-                else:
-                    reader = easyocr.Reader(['en', 'ko'])
-                    res = reader.readtext(temp_file_path, detail=0, paragraph=True)
-                    txt_path = os.path.join(output_folder, "ocr_result.txt")
-                    with open(txt_path, 'w', encoding='utf-8') as f:
-                        f.write('\n'.join(res))
-                
-                for file in os.listdir(output_folder):
-                    if file.endswith('.txt'):
-                        with open(os.path.join(output_folder, file), 'r', encoding='utf-8') as f:
-                            st.text_area(f"OCR 결과 - {file}", f.read(), height=200)
+                if item[1].name.lower().endswith(".pptx"):
+                    # PPTX는 렌더링 없이 문서에서 직접 추출
+                    return "pptx", output_folder, temp_file_path
+                if item[1].type != "application/pdf":
+                    return "images", output_folder, [temp_file_path]
+                if adaptive:
+                    # 적응형 모드는 OCR 중에 영역별로 렌더링하므로 미리 렌더링하지 않음 (시간 예산이 있으면 페이지 단위로 적용)
+                    return "adaptive", output_folder, temp_file_path
+                if deadline is not None:
+                    # 시간 예산 모드는 페이지 단위로 렌더링하며 OCR
+                    return "deadline", output_folder, temp_file_path
+                image_paths = pdf_to_images(temp_file_path, output_folder)
+                if not image_paths:
+                    raise Exception("PDF를 이미지로 변환하는데 실패했습니다.")
+                return "images", output_folder, image_paths
+
+            def process(item, prepared, report, live):
+                kind, output_folder, source = prepared
+                if kind in ("pptx", "images") and get_time_budget(deadline) == 0:
+                    raise Exception("시간 예산이 다 되어 처리하지 않았습니다.")
+                if kind == "pptx":
+                    slides_text = pptx_native_ocr(source, output_folder, reader, report)
+                    if not slides_text:
+                        raise Exception("PPTX에서 텍스트를 추출하는데 실패했습니다.")
+                    txt_paths = [os.path.join(output_folder, f"ocr_result_{slide_num}.txt") for slide_num in sorted(slides_text)]
+                    return to_zip_entries(txt_paths, item[0])
+                if kind == "deadline" or (kind == "adaptive" and deadline is not None):
+                    with fitz.open(source) as doc:
+                        page_count = len(doc)
+                    if kind == "adaptive":
+                        results = iter_adaptive_pdf_ocr(source, output_folder, get_time_budget(deadline), reader,
+                                                        confidence_threshold=confidence_threshold)
+                        extra_paths = [os.path.join(output_folder, "ocr_stats.json")]
+                    else:
+                        results = iter_pdf_image_ocr(source, output_folder, get_time_budget(deadline), reader)
+                        extra_paths = []
+                    summary = stream_page_results(
+                        results,
+                        live,
+                        lambda page_num, text: st.text_area(f"OCR 결과 - {item[0]} 페이지 {page_num}", text, height=200),
+                        report, page_count
+                    )
+                    txt_paths = [os.path.join(output_folder, f"ocr_result_{page_num}.txt") for page_num in summary["done"]]
+                    return to_zip_entries(txt_paths + extra_paths + [write_deadline_report(summary, output_folder)], item[0])
+                if kind == "adaptive":
+                    ocr_results, _ = adaptive_pdf_ocr(source, output_folder, reader,
+                                                      confidence_threshold=confidence_threshold, progress_callback=report)
+                    txt_paths = [os.path.join(output_folder, f"ocr_result_{i+1}.txt") for i in range(len(ocr_results))]
+                    return to_zip_entries(txt_paths + [os.path.join(output_folder, "ocr_stats.json")], item[0])
+                ocr_images(source, output_folder, reader, report)
+                txt_paths = [os.path.join(output_folder, f"ocr_result_{i+1}.txt") for i in range(len(source))]
+                return to_zip_entries(txt_paths, item[0])
+
+            run_batch(uploaded_files, prepare, process, "ocr_results.zip")
+        else:
+            show_last_batch(uploaded_files, "ocr_results.zip")
 
     elif choice == "TXT to PDF":
         st.subheader("TXT를 PDF로 변환")
-        uploaded_file = st.file_uploader("TXT 파일을 업로드하세요", type=["txt"])
-        if uploaded_file:
-            with st.spinner("TXT를 PDF로 변환 중..."):
-                with tempfile.NamedTemporaryFile(delete=False, suffix=".txt") as temp_file:
-                    temp_file.write(uploaded_file.read())
-                    temp_file_path = temp_file.name
-                
-                output_pdf = tempfile.NamedTemporaryFile(delete=False, suffix=".pdf").name
-                txt_to_pdf_convert(os.path.dirname(temp_file_path), output_pdf)
-                st.success(f"PDF로 변환되었습니다: {output_pdf}")
-                
-                with open(output_pdf, "rb") as file:
-                    st.download_button(
-                        label="변환된 PDF 다운로드",
-                        data=file,
-                        file_name="converted.pdf",
-                        mime="application/pdf"
-                    )
+        uploaded_files = st.file_uploader("TXT 파일을 업로드하세요", type=["txt"], accept_multiple_files=True)
+        if uploaded_files and st.button("일괄 처리 시작"):
+            def prepare(item):
+                # 파일마다 별도 폴더에 저장해 다른 txt 파일이 섞이지 않도록 함
+                txt_folder = tempfile.mkdtemp()
+                with open(os.path.join(txt_folder, f"{item[0]}.txt"), "wb") as temp_file:
+                    temp_file.write(item[1].getvalue())
+                return txt_folder
+
+            def process(item, txt_folder, report, live):
+                output_pdf = os.path.join(tempfile.mkdtemp(), f"{item[0]}.pdf")
+                if not txt_to_pdf_convert(txt_folder, output_pdf):
+                    raise Exception("TXT를 PDF로 변환하는데 실패했습니다.")
+                return [(output_pdf, f"{item[0]}.pdf")]
+
+            run_batch(uploaded_files, prepare, process, "converted_pdf.zip")
+        else:
+            show_last_batch(uploaded_files, "converted_pdf.zip")
 
     elif choice == "PDF to HTML":
         st.subheader("PDF를 HTML로 변환")
-        uploaded_file = st.file_uploader("PDF 파일을 업로드하세요", type=["pdf"])
-        if uploaded_file:
-            with st.spinner("PDF를 HTML로 변환 중..."):
-                with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as temp_file:
-                    temp_file.write(uploaded_file.read())
-                    temp_file_path = temp_file.name
-                
-                output_html = tempfile.NamedTemporaryFile(delete=False, suffix=".html").name
-                pdf_to_html(temp_file_path, output_html)
-                st.success(f"HTML로 변환되었습니다: {output_html}")
+        uploaded_files = st.file_uploader("PDF 파일을 업로드하세요", type=["pdf"], accept_multiple_files=True)
+        if uploaded_files and st.button("일괄 처리 시작"):
+            def prepare(item):
+                return save_uploaded_file(item[1], ".pdf")
+
+            def process(item, temp_file_path, report, live):
+                output_html = os.path.join(tempfile.mkdtemp(), f"{item[0]}.html")
+                if not pdf_to_html(temp_file_path, output_html):
+                    raise Exception("PDF를 HTML로 변환하는데 실패했습니다.")
+                return [(output_html, f"{item[0]}.html")]
+
+            run_batch(uploaded_files, prepare, process, "converted_html.zip")
+        else:
+            show_last_batch(uploaded_files, "converted_html.zip")
+
+    elif choice == "PDF to Markdown":
+        st.subheader("PDF를 Markdown으로 변환")
+        uploaded_files = st.file_uploader("PDF 파일을 업로드하세요", type=["pdf"], accept_multiple_files=True)
+        engine = st.selectbox("변환 엔진", ["pymupdf", "pdfplumber"])
+        time_budget = st.number_input("시간 예산(초, 0이면 제한 없음)", min_value=0, value=0, step=5)
+        if uploaded_files and st.button("일괄 처리 시작"):
+            deadline = time.monotonic() + time_budget if time_budget else None
+
+            def prepare(item):
+                # 이미지 폴더 이름에 원본 파일명을 쓰도록 원래 이름으로 저장
+                temp_file_path = os.path.join(tempfile.mkdtemp(), f"{item[0]}.pdf")
+                with open(temp_file_path, "wb") as temp_file:
+                    temp_file.write(item[1].getvalue())
+                # Markdown과 이미지는 파일마다 별도 폴더에 저장
+                return temp_file_path, tempfile.mkdtemp()
+
+            def process(item, prepared, report, live):
+                temp_file_path, output_folder = prepared
+                with fitz.open(temp_file_path) as doc:
+                    page_count = len(doc)
+                pages_markdown = {}
+
+                def render(page_num, markdown):
+                    pages_markdown[page_num] = markdown
+                    st.markdown(markdown)
+
+                summary = stream_page_results(
+                    iter_pdf_to_markdown(temp_file_path, get_time_budget(deadline), engine=engine,
+                                         image_mode="passthrough", output_root=output_folder),
+                    live, render, report, page_count
+                )
+                output_md = os.path.join(output_folder, f"{item[0]}.md")
+                with open(output_md, "w", encoding="utf-8") as f:
+                    f.write(''.join(pages_markdown[page_num] for page_num in sorted(pages_markdown)))
+                write_deadline_report(summary, output_folder)
                 
-                with open(output_html, "r", encoding="utf-8") as file:
-                    st.download_button(
-                        label="변환된 HTML 다운로드",
-                        data=file.read(),
-                        file_name="converted.html",
-                        mime="text/html"
-                    )
+                # 이미지 링크가 Markdown 기준 상대 경로이므로 폴더 구조 그대로 묶음
+                output_paths = [os.path.join(root, f) for root, _, files in os.walk(output_folder) for f in files]
+                return [(path, f"{item[0]}/{os.path.relpath(path, output_folder)}") for path in sorted(output_paths)]
+
+            run_batch(uploaded_files, prepare, process, "markdown.zip")
+        else:
+            show_last_batch(uploaded_files, "markdown.zip")
 
     elif choice == "Extract Images from PDF":
         st.subheader("PDF에서 이미지 추출")
-        uploaded_file = st.file_uploader("PDF 파일을 업로드하세요", type=["pdf"])
-        if uploaded_file:
-            with st.spinner("PDF에서 이미지 추출 중..."):
-                with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as temp_file:
-                    temp_file.write(uploaded_file.read())
-                    temp_file_path = temp_file.name
-                
+        uploaded_files = st.file_uploader("PDF 파일을 업로드하세요", type=["pdf"], accept_multiple_files=True)
+        time_budget = st.number_input("시간 예산(초, 0이면 제한 없음) - 페이지 단위로 처리해 완료되는 대로 표시", min_value=0, value=0, step=5)
+        if uploaded_files and st.button("일괄 처리 시작"):
+            reader = get_ocr_reader()
+            deadline = time.monotonic() + time_budget if time_budget else None
+
+            def prepare(item):
+                temp_file_path = save_uploaded_file(item[1], ".pdf")
                 output_folder = tempfile.mkdtemp()
-                extract_image_from_pdf(temp_file_path, output_folder)
-                
-                for file in os.listdir(output_folder):
-                    if file.endswith(('.png', '.jpg', '.jpeg')):
-                        st.image(Image.open(os.path.join(output_folder, file)), caption=file)
-                    elif file.endswith('.txt'):
-                        with open(os.path.join(output_folder, file), 'r', encoding='utf-8') as f:
-                            st.text_area(f"OCR 결과 - {file}", f.read(), height=200)
+                if deadline is not None:
+                    # 시간 예산 모드는 처리 단계에서 페이지 단위로 추출
+                    return output_folder, temp_file_path, None
+                return output_folder, temp_file_path, extract_images(temp_file_path, output_folder)
+
+            def process(item, prepared, report, live):
+                output_folder, temp_file_path, extracted = prepared
+                if deadline is not None:
+                    with fitz.open(temp_file_path) as doc:
+                        page_count = len(doc)
+                    outputs = []
+
+                    def render(page_num, page_outputs):
+                        for image_path, text_path in page_outputs:
+                            outputs.extend([image_path, text_path])
+                            if image_path.lower().endswith(('.png', '.jpg', '.jpeg')):
+                                st.image(Image.open(image_path), caption=os.path.basename(image_path))
+                            with open(text_path, 'r', encoding='utf-8') as f:
+                                st.text_area(f"OCR 결과 - {item[0]}/{os.path.basename(text_path)}", f.read(), height=200)
+
+                    summary = stream_page_results(
+                        iter_extract_images(temp_file_path, output_folder, get_time_budget(deadline), reader),
+                        live, render, report, page_count
+                    )
+                    return to_zip_entries(outputs + [write_deadline_report(summary, output_folder)], item[0])
+                text_paths = ocr_extracted_images(extracted, output_folder, reader, report)
+                image_paths = [image_path for _, _, image_path in extracted]
+                return to_zip_entries(image_paths + text_paths, item[0])
+
+            run_batch(uploaded_files, prepare, process, "extracted_images.zip")
+        else:
+            show_last_batch(uploaded_files, "extracted_images.zip")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -1,8 +1,14 @@
 import os
+import io
 from pptx import Presentation
+from pptx.shapes.picture import Picture
+from PIL import Image
 import base64
 import urllib.parse
 
+OCR_IMAGE_EXTENSIONS = ("png", "jpg", "jpeg", "bmp", "tif", "tiff")  # OCR 엔진이 바로 읽을 수 있는 형식
+MIN_OCR_IMAGE_SIZE = 32  # 이보다 작은 이미지(아이콘 등)는 OCR하지 않음
+
 def get_shape_text(shape):
     text = ""
     try:
@@ -67,9 +73,59 @@ def get_shape_text(shape):
         
     return text
 
-def process_pptx(file_path):
+def get_shape_images(shape):
+    """
+    도형(그룹 도형 포함)에 들어 있는 그림의 이미지 목록을 반환하는 함수
+    """
+    images = []
+    if hasattr(shape, "shape_type") and shape.shape_type == 6:  # 6은 그룹 도형을 의미
+        for subshape in shape.shapes:
+            images += get_shape_images(subshape)
+    elif isinstance(shape, Picture):
+        try:
+            images.append(shape.image)
+        except (AttributeError, ValueError, KeyError):
+            # 링크된 그림처럼 내장 이미지가 없는 경우 무시
+            pass
+    return images
+
+def ocr_image(image, reader):
+    """
+    슬라이드에 내장된 이미지에 OCR을 수행하는 함수
+
+    :param image: python-pptx Image 객체
+    :param reader: easyocr.Reader
+    :return: OCR 결과 텍스트
+    """
+    try:
+        width, height = image.size
+        if width < MIN_OCR_IMAGE_SIZE or height < MIN_OCR_IMAGE_SIZE:
+            return ""
+        blob = image.blob
+        if image.ext.lower() not in OCR_IMAGE_EXTENSIONS:
+            # GIF 등 OCR 엔진이 읽지 못하는 형식만 PNG로 변환
+            buffer = io.BytesIO()
+            Image.open(io.BytesIO(blob)).convert('RGB').save(buffer, "PNG")
+            blob = buffer.getvalue()
+        return '\n'.join(reader.readtext(blob, detail=0, paragraph=True))
+    except Exception as e:
+        print(f"이미지 OCR 처리 중 오류 발생 ({image.ext}): {str(e)}")
+        return ""
+
+def process_pptx(file_path, reader=None, progress_callback=None):
+    """
+    PPTX 파일의 슬라이드별 텍스트를 Markdown으로 추출하는 함수
+    reader를 주면 그림 도형의 내장 이미지만 OCR해 슬라이드 내용에 덧붙입니다.
+    같은 이미지는 슬라이드가 달라도 한 번만 OCR합니다.
+
+    :param file_path: PPTX 파일 경로
+    :param reader: 그림 OCR에 사용할 easyocr.Reader, None이면 OCR하지 않음
+    :param progress_callback: progress_callback(완료 수, 전체 수), 슬라이드마다 호출
+    :return: {슬라이드 번호: Markdown 텍스트} 딕셔너리
+    """
     prs = Presentation(file_path)
     slides_text = {}
+    ocr_cache = {}  # 이미지 SHA1 -> OCR 결과
     
     for slide_number, slide in enumerate(prs.slides):
         current_slide_text = []
@@ -84,6 +140,19 @@ def process_pptx(file_path):
             if text:
                 current_slide_text.append(text)
         
+        # 그림 도형의 이미지 OCR 처리
+        if reader is not None:
+            image_texts = []
+            for shape in slide.shapes:
+                for image in get_shape_images(shape):
+                    if image.sha1 not in ocr_cache:
+                        ocr_cache[image.sha1] = ocr_image(image, reader)
+                    if ocr_cache[image.sha1]:
+                        image_texts.append(ocr_cache[image.sha1] + "\n")
+            if image_texts:
+                current_slide_text.append("\n### 이미지 텍스트:\n")
+                current_slide_text.extend(image_texts)
+        
         # 슬라이드 노트 처리
         if slide.notes_slide and slide.notes_slide.notes_text_frame:
             notes_text = slide.notes_slide.notes_text_frame.text.strip()
@@ -93,6 +162,8 @@ def process_pptx(file_path):
         
         if current_slide_text:
             slides_text[slide_number + 1] = ''.join(current_slide_text)
+        if progress_callback:
+            progress_callback(slide_number + 1, len(prs.slides))
     
     return slides_text
 
@@ -115,40 +186,41 @@ def decode_filename(filename):
 
     return filename
 
-# result 폴더가 없으면 생성
-result_folder = "result"
-if not os.path.exists(result_folder):
-    os.makedirs(result_folder)
+if __name__ == "__main__":
+    # result 폴더가 없으면 생성
+    result_folder = "result"
+    if not os.path.exists(result_folder):
+        os.makedirs(result_folder)
 
-# data 폴더의 모든 pptx 파일 처리
-data_folder = "data"
-for filename in os.listdir(data_folder):
-    if filename.endswith(".pptx"):
-        try:
-            # 파일명 디코딩 추가
-            decoded_filename = decode_filename(filename)
-            file_path = os.path.join(data_folder, filename)
+    # data 폴더의 모든 pptx 파일 처리
+    data_folder = "data"
+    for filename in os.listdir(data_folder):
+        if filename.endswith(".pptx"):
+            try:
+                # 파일명 디코딩 추가
+                decoded_filename = decode_filename(filename)
+                file_path = os.path.join(data_folder, filename)
             
-            # 결과 파일명 생성 (확장자를 txt로 변경)
-            output_filename = os.path.splitext(decoded_filename)[0] + "_extracted.md"
-            output_path = os.path.join(result_folder, output_filename)
+                # 결과 파일명 생성 (확장자를 txt로 변경)
+                output_filename = os.path.splitext(decoded_filename)[0] + "_extracted.md"
+                output_path = os.path.join(result_folder, output_filename)
             
-            # 파일이 이미 존재하는 경우 건너뛰기
-            if os.path.exists(output_path):
-                print(f"파일이 이미 존재합니다: {output_filename}")
-                continue
+                # 파일이 이미 존재하는 경우 건너뛰기
+                if os.path.exists(output_path):
+                    print(f"파일이 이미 존재합니다: {output_filename}")
+                    continue
             
-            # PPT 처리
-            slides_text = process_pptx(file_path)
+                # PPT 처리
+                slides_text = process_pptx(file_path)
             
-            # 결과 저장
-            with open(output_path, 'w', encoding='utf-8') as file:            
-                for slide_num in sorted(slides_text.keys()):
-                    file.write(f"# Slide {slide_num}:\n{slides_text[slide_num]}\n\n")
+                # 결과 저장
+                with open(output_path, 'w', encoding='utf-8') as file:            
+                    for slide_num in sorted(slides_text.keys()):
+                        file.write(f"# Slide {slide_num}:\n{slides_text[slide_num]}\n\n")
                     
-            print(f"성공적으로 처리됨: {filename}")
+                print(f"성공적으로 처리됨: {filename}")
             
-        except Exception as e:
-            print(f"파일 처리 중 오류 발생: {filename}")
-            print(f"오류 내용: {str(e)}")
-            continue
+            except Exception as e:
+                print(f"파일 처리 중 오류 발생: {filename}")
+                print(f"오류 내용: {str(e)}")
+                continue
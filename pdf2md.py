@@ -1,8 +1,27 @@
 import pdfplumber
+import fitz
 import re
 import os
+import time
+import hashlib
+import tempfile
+from collections import Counter
 from PIL import Image, ImageOps
+from pdfminer.pdftypes import resolve1, LITERALS_DCT_DECODE, LITERALS_JPX_DECODE
+from pdfminer.psparser import literal_name
 import io
+from pipeline import iter_with_deadline
+
+ENGINES = ("pdfplumber", "pymupdf")
+HEADING_SIZE_RATIO = 1.15  # 본문 글자 크기 대비 이 비율 이상이면 제목으로 간주
+HEADING_MAX_LENGTH = 80    # 이보다 긴 줄은 글자가 커도 제목으로 보지 않음
+HEADING_SAMPLE_PAGES = 20  # 페이지 단위 변환에서 본문 글자 크기를 추정할 때 살펴볼 최대 페이지 수
+IMAGE_MODES = ("png", "passthrough")
+# 디코딩/재인코딩 없이 원본 바이트를 그대로 저장할 수 있는 형식과 확장자
+PASSTHROUGH_FORMATS = {"JPEG": "jpg", "PNG": "png", "GIF": "gif", "WEBP": "webp"}
+# PDF 원시 픽셀 이미지의 색 구성 요소 수 -> PIL 모드
+RAW_IMAGE_MODES = {1: "L", 3: "RGB", 4: "CMYK"}
+COLORSPACE_COMPONENTS = {"DeviceGray": 1, "CalGray": 1, "G": 1, "DeviceRGB": 3, "CalRGB": 3, "RGB": 3, "DeviceCMYK": 4, "CMYK": 4}
 
 def extract_tables_with_pdfplumber(pdf_path):
     """
@@ -40,54 +59,457 @@ def print_tables(tables):
         print("추출된 테이블이 없습니다.")
 
 
-def convert_pdf_to_markdown(pdf_path):
+def convert_pdf_to_markdown(pdf_path, engine="pdfplumber", image_mode="png", output_root=None):
     """
     PDF 파일을 Markdown으로 변환하는 함수.
 
     :param pdf_path: PDF 파일 경로
+    :param engine: 변환 엔진, "pdfplumber" 또는 "pymupdf"
+    :param image_mode: 이미지 저장 방식, "png"(모두 PNG로 변환) 또는
+                       "passthrough"(가능하면 원본 그대로, 문서별 폴더에 내용 해시 이름으로 저장)
+    :param output_root: 이미지 폴더(images/)를 만들 경로, None이면 현재 작업 폴더.
+                        지정하면 이미지 링크는 이 경로 기준 상대 경로가 됩니다.
     :return: Markdown 문자열
     """
+    check_options(engine, image_mode)
+    if engine == "pymupdf":
+        return convert_pdf_to_markdown_pymupdf(pdf_path, image_mode, output_root)
+
     markdown_content = ""
-    image_folder = "images"
+    image_folder = get_image_folder(pdf_path, image_mode, output_root)
     os.makedirs(image_folder, exist_ok=True)
 
     with pdfplumber.open(pdf_path) as pdf:
         for page_num, page in enumerate(pdf.pages, start=1):
-            print(f"페이지 {page_num} 변환 중...")
-            
-            # 페이지 번호를 대제목으로 추가
-            markdown_content += f"# 페이지 {page_num}\n\n"
-            
-            # 텍스트 추출 및 변환
-            text = page.extract_text()
-            markdown_content += convert_text_to_markdown(text)
-            
-            # 테이블 추출 및 변환
-            tables = page.extract_tables()
-            for table in tables:
-                markdown_content += convert_table_to_markdown(table)
-            
-            # 이미지 추출 및 변환
-            images = page.images
-            for i, img in enumerate(images):
-                try:
-                    image = Image.open(io.BytesIO(img['stream'].get_data()))
-                    if image.mode == 'CMYK':
-                        image = ImageOps.invert(image.convert('RGB'))
-                    else:
-                        image = image.convert('RGB')
-                    image_filename = f"page_{page_num}_image_{i+1}.png"
-                    image_path = os.path.join(image_folder, image_filename)
-                    image.save(image_path)
-                    markdown_content += f"![페이지 {page_num} 이미지 {i+1}]({image_path})\n\n"
-                except Exception as e:
-                    print(f"페이지 {page_num}의 이미지 {i+1} 처리 중 오류 발생: {str(e)}")
-                    continue
-            
-            markdown_content += "\n\n"  # 페이지 구분
+            markdown_content += convert_page_to_markdown(page, page_num, image_folder, image_mode, output_root)
+
+    return markdown_content
+
+def iter_pdf_to_markdown(pdf_path, time_budget=None, engine="pdfplumber", image_mode="png", output_root=None):
+    """
+    PDF를 페이지 단위로 Markdown으로 변환해 완료되는 대로 내보내는 함수.
+    첫 페이지부터 순서대로 처리하며, 시간 예산이 다 되면 남은 페이지를 "pending"으로 내보내고 멈춥니다.
+    페이지 하나의 오류는 해당 페이지만 "error"로 기록합니다.
+    pymupdf 엔진은 전체 페이지를 미리 훑지 않고, 고르게 고른 최대 HEADING_SAMPLE_PAGES개 페이지로
+    본문 글자 크기를 추정합니다.
+
+    :param pdf_path: PDF 파일 경로
+    :param time_budget: 시간 예산(초), None이면 제한 없음
+    :param engine: 변환 엔진, "pdfplumber" 또는 "pymupdf"
+    :param image_mode: 이미지 저장 방식, "png" 또는 "passthrough"
+    :param output_root: 이미지 폴더(images/)를 만들 경로, None이면 현재 작업 폴더
+    :return: 페이지별 결과 딕셔너리 제너레이터 (pipeline.iter_with_deadline 참고), result는 페이지 Markdown
+    """
+    check_options(engine, image_mode)
+    start_time = time.monotonic()
+    image_folder = get_image_folder(pdf_path, image_mode, output_root)
+    os.makedirs(image_folder, exist_ok=True)
+
+    if engine == "pymupdf":
+        with fitz.open(pdf_path) as doc:
+            sampled_lines = {page_num: extract_lines_with_size(doc[page_num - 1])
+                             for page_num in sample_page_numbers(len(doc), HEADING_SAMPLE_PAGES)}
+            heading_levels = detect_heading_levels(sampled_lines.values())
+            exported_xrefs = {}
+            # 글자 크기 표본 수집에 쓴 시간도 예산에서 차감
+            if time_budget is not None:
+                time_budget -= time.monotonic() - start_time
+
+            def convert_page(page_num):
+                lines = sampled_lines.pop(page_num, None)
+                if lines is None:
+                    lines = extract_lines_with_size(doc[page_num - 1])
+                return convert_page_to_markdown_pymupdf(doc, page_num, lines, heading_levels,
+                                                        image_folder, image_mode, exported_xrefs, output_root)
+
+            yield from iter_with_deadline(list(range(1, len(doc) + 1)), convert_page, time_budget)
+        return
+
+    with pdfplumber.open(pdf_path) as pdf:
+        yield from iter_with_deadline(
+            list(range(1, len(pdf.pages) + 1)),
+            lambda page_num: convert_page_to_markdown(pdf.pages[page_num - 1], page_num, image_folder, image_mode, output_root),
+            time_budget
+        )
+
+def sample_page_numbers(page_count, sample_size):
+    """
+    문서 전체에서 고르게 떨어진 페이지 번호를 최대 sample_size개 고르는 함수.
+    """
+    if page_count <= sample_size:
+        return list(range(1, page_count + 1))
+    step = (page_count - 1) / (sample_size - 1)
+    return sorted({round(i * step) + 1 for i in range(sample_size)})
+
+def check_options(engine, image_mode):
+    """
+    변환 엔진과 이미지 저장 방식이 올바른지 확인하는 함수.
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"지원하지 않는 엔진입니다: {engine} (사용 가능: {', '.join(ENGINES)})")
+    if image_mode not in IMAGE_MODES:
+        raise ValueError(f"지원하지 않는 이미지 저장 방식입니다: {image_mode} (사용 가능: {', '.join(IMAGE_MODES)})")
+
+def convert_page_to_markdown(page, page_num, image_folder, image_mode="png", output_root=None):
+    """
+    pdfplumber 페이지 하나를 Markdown으로 변환하는 함수.
+
+    :param page: pdfplumber 페이지 객체
+    :param page_num: 페이지 번호
+    :param image_folder: 이미지를 저장할 폴더 경로
+    :param image_mode: 이미지 저장 방식, "png" 또는 "passthrough"
+    :param output_root: 이미지 링크의 기준 경로, None이면 저장 경로를 그대로 사용
+    :return: 페이지 Markdown 문자열
+    """
+    print(f"페이지 {page_num} 변환 중...")
+    
+    # 페이지 번호를 대제목으로 추가
+    markdown_content = f"# 페이지 {page_num}\n\n"
+    
+    # 텍스트 추출 및 변환
+    text = page.extract_text()
+    markdown_content += convert_text_to_markdown(text)
+    
+    # 테이블 추출 및 변환
+    tables = page.extract_tables()
+    for table in tables:
+        markdown_content += convert_table_to_markdown(table)
+    
+    # 이미지 추출 및 변환
+    images = page.images
+    for i, img in enumerate(images):
+        try:
+            markdown_content += convert_image_to_markdown(get_pdfplumber_image_bytes(img), page_num, i + 1, image_folder, image_mode, output_root)
+        except Exception as e:
+            print(f"페이지 {page_num}의 이미지 {i+1} 처리 중 오류 발생: {str(e)}")
+            continue
+    
+    markdown_content += "\n\n"  # 페이지 구분
+    return markdown_content
+
+def convert_pdf_to_markdown_pymupdf(pdf_path, image_mode="png", output_root=None):
+    """
+    PyMuPDF를 사용해 PDF 파일을 Markdown으로 변환하는 함수.
+    글자 크기 통계로 제목을 찾고, page.find_tables()로 테이블을 추출합니다.
+    출력 형식은 pdfplumber 엔진과 같습니다.
+
+    :param pdf_path: PDF 파일 경로
+    :param image_mode: 이미지 저장 방식, "png" 또는 "passthrough"
+    :param output_root: 이미지 폴더(images/)를 만들 경로, None이면 현재 작업 폴더
+    :return: Markdown 문자열
+    """
+    markdown_content = ""
+    image_folder = get_image_folder(pdf_path, image_mode, output_root)
+    os.makedirs(image_folder, exist_ok=True)
+    exported_xrefs = {}  # passthrough 모드에서 여러 페이지에 반복되는 이미지는 한 번만 추출
 
+    with fitz.open(pdf_path) as doc:
+        # 1차: 모든 페이지의 줄과 글자 크기 수집
+        pages_lines = [extract_lines_with_size(page) for page in doc]
+        heading_levels = detect_heading_levels(pages_lines)
+
+        # 2차: 페이지별 Markdown 생성
+        for page_num, lines in enumerate(pages_lines, start=1):
+            markdown_content += convert_page_to_markdown_pymupdf(doc, page_num, lines, heading_levels,
+                                                                 image_folder, image_mode, exported_xrefs, output_root)
+
+    return markdown_content
+
+def convert_page_to_markdown_pymupdf(doc, page_num, lines, heading_levels, image_folder, image_mode, exported_xrefs,
+                                     output_root=None):
+    """
+    PyMuPDF 페이지 하나를 Markdown으로 변환하는 함수.
+
+    :param doc: fitz.Document 객체
+    :param page_num: 페이지 번호
+    :param lines: 해당 페이지의 extract_lines_with_size 결과
+    :param heading_levels: detect_heading_levels 결과
+    :param image_folder: 이미지를 저장할 폴더 경로
+    :param image_mode: 이미지 저장 방식, "png" 또는 "passthrough"
+    :param exported_xrefs: 문서 안에서 이미 저장한 이미지 {xref: 경로}, passthrough 모드에서 갱신
+    :param output_root: 이미지 링크의 기준 경로, None이면 저장 경로를 그대로 사용
+    :return: 페이지 Markdown 문자열
+    """
+    print(f"페이지 {page_num} 변환 중...")
+    page = doc[page_num - 1]
+    
+    # 페이지 번호를 대제목으로 추가
+    markdown_content = f"# 페이지 {page_num}\n\n"
+    
+    # 테이블 영역은 본문에서 제외하고 테이블로만 출력
+    # 선 기반 테이블 탐지는 벡터 그림이 없는 페이지에서 결과가 없으므로 건너뜀
+    tables = page.find_tables().tables if page.get_cdrawings() else []
+    table_rects = [fitz.Rect(table.bbox) for table in tables]
+
+    text_lines = []
+    for text, size, bbox in lines:
+        rect = fitz.Rect(bbox)
+        center = fitz.Point((rect.x0 + rect.x1) / 2, (rect.y0 + rect.y1) / 2)
+        if any(center in table_rect for table_rect in table_rects):
+            continue
+        level = get_heading_level(size, heading_levels)
+        if level and len(text.strip()) <= HEADING_MAX_LENGTH:
+            text_lines.append(f"{'#' * level} {text}\n")
+        else:
+            text_lines.append(text)
+    markdown_content += '\n'.join(text_lines)
+    
+    # 테이블 추출 및 변환
+    for table in tables:
+        markdown_content += convert_table_to_markdown(table.extract())
+    
+    # 이미지 추출 및 변환
+    for i, img in enumerate(page.get_images()):
+        try:
+            xref = img[0]
+            if image_mode == "passthrough":
+                if xref not in exported_xrefs:
+                    exported_xrefs[xref] = save_image_passthrough(doc.extract_image(xref)["image"], image_folder)
+                markdown_content += f"![페이지 {page_num} 이미지 {i+1}]({get_image_link(exported_xrefs[xref], output_root)})\n\n"
+            else:
+                image_bytes = doc.extract_image(xref)["image"]
+                markdown_content += convert_image_to_markdown(image_bytes, page_num, i + 1, image_folder, output_root=output_root)
+        except Exception as e:
+            print(f"페이지 {page_num}의 이미지 {i+1} 처리 중 오류 발생: {str(e)}")
+            continue
+    
+    markdown_content += "\n\n"  # 페이지 구분
     return markdown_content
 
+def extract_lines_with_size(page):
+    """
+    PyMuPDF 페이지에서 줄 단위 텍스트와 글자 크기를 추출하는 함수.
+
+    :param page: fitz.Page 객체
+    :return: (줄 텍스트, 글자 크기, bbox) 튜플 리스트
+    """
+    lines = []
+    page_dict = page.get_text("dict", flags=fitz.TEXTFLAGS_TEXT, sort=True)
+    for block in page_dict["blocks"]:
+        for line in block.get("lines", []):
+            spans = [span for span in line["spans"] if span["text"].strip()]
+            if not spans:
+                continue
+            text = "".join(span["text"] for span in line["spans"]).strip()
+            # 줄의 글자 크기는 가장 많은 글자를 차지하는 span 기준
+            size = max(spans, key=lambda span: len(span["text"].strip()))["size"]
+            lines.append((text, size, line["bbox"]))
+    return lines
+
+def detect_heading_levels(pages_lines):
+    """
+    글자 크기 통계로 본문 크기와 제목 크기를 결정하는 함수.
+    가장 많은 글자에 쓰인 크기를 본문 크기로 보고, 그보다 충분히 큰 크기를 제목 크기로 봅니다.
+
+    :param pages_lines: 페이지별 extract_lines_with_size 결과 이터러블 (전체 또는 일부 페이지)
+    :return: {"body_size": 본문 크기, "heading_sizes": 큰 순서로 정렬한 제목 크기 리스트}, 글자가 없으면 None
+    """
+    size_counts = Counter()
+    for lines in pages_lines:
+        for text, size, _ in lines:
+            size_counts[round(size, 1)] += len(text)
+
+    if not size_counts:
+        return None
+
+    body_size = size_counts.most_common(1)[0][0]
+    heading_sizes = sorted((size for size in size_counts if size >= body_size * HEADING_SIZE_RATIO), reverse=True)
+    return {"body_size": body_size, "heading_sizes": heading_sizes}
+
+def get_heading_level(size, heading_levels):
+    """
+    글자 크기에 해당하는 제목 수준(1~3)을 반환하는 함수, 제목이 아니면 0.
+    통계에 없던 크기도 더 큰 제목 크기의 개수로 수준을 정합니다.
+
+    :param size: 글자 크기
+    :param heading_levels: detect_heading_levels 결과
+    """
+    size = round(size, 1)
+    if not heading_levels or size < heading_levels["body_size"] * HEADING_SIZE_RATIO:
+        return 0
+    larger_count = sum(1 for heading_size in heading_levels["heading_sizes"] if heading_size > size)
+    return min(larger_count + 1, 3)
+
+def get_image_folder(pdf_path, image_mode, output_root=None):
+    """
+    이미지 저장 방식에 맞는 이미지 폴더 경로를 반환하는 함수.
+    passthrough 모드는 문서마다 별도 폴더(images/<문서명>)를 사용하며,
+    Markdown 링크가 깨지지 않도록 문서명의 공백과 괄호 등은 "_"로 바꿉니다.
+    """
+    image_root = os.path.join(output_root, "images") if output_root else "images"
+    if image_mode == "passthrough":
+        document_name = os.path.splitext(os.path.basename(pdf_path))[0]
+        return os.path.join(image_root, re.sub(r"[^\w.-]+", "_", document_name))
+    return image_root
+
+def get_image_link(image_path, output_root=None):
+    """
+    Markdown에 넣을 이미지 링크를 반환하는 함수, output_root가 있으면 그 기준 상대 경로.
+    """
+    if output_root:
+        return os.path.relpath(image_path, output_root).replace(os.sep, "/")
+    return image_path
+
+def convert_image_to_markdown(image_bytes, page_num, image_num, image_folder, image_mode="png", output_root=None):
+    """
+    이미지 데이터를 저장하고 Markdown 이미지 링크를 반환하는 함수.
+
+    :param image_bytes: 이미지 데이터
+    :param page_num: 페이지 번호
+    :param image_num: 페이지 내 이미지 번호
+    :param image_folder: 이미지를 저장할 폴더 경로
+    :param image_mode: 이미지 저장 방식, "png" 또는 "passthrough"
+    :param output_root: 이미지 링크의 기준 경로, None이면 저장 경로를 그대로 사용
+    :return: Markdown 이미지 링크 문자열
+    """
+    if image_mode == "passthrough":
+        image_path = save_image_passthrough(image_bytes, image_folder)
+    else:
+        image = transcode_image(Image.open(io.BytesIO(image_bytes)))
+        image_filename = f"page_{page_num}_image_{image_num}.png"
+        image_path = os.path.join(image_folder, image_filename)
+        image.save(image_path)
+    return f"![페이지 {page_num} 이미지 {image_num}]({get_image_link(image_path, output_root)})\n\n"
+
+def get_pdfplumber_image_bytes(img):
+    """
+    pdfplumber 이미지 객체에서 이미지 파일 데이터를 얻는 함수.
+    JPEG/JPEG2000 스트림은 그대로 이미지 파일이므로 원본 바이트를 반환하고,
+    FlateDecode 등으로 압축된 원시 픽셀 데이터는 /Width, /Height, /ColorSpace, /BitsPerComponent로
+    이미지를 다시 만들어 PNG로 인코딩합니다. (알파 채널(/SMask)은 사용하지 않음)
+
+    :param img: pdfplumber page.images의 항목
+    :return: 이미지 파일 바이트
+    """
+    stream = img['stream']
+    filters = [name for name, _ in stream.get_filters()]  # get_data() 이후에는 필터 정보가 지워짐
+    data = stream.get_data()
+    if any(name in LITERALS_DCT_DECODE or name in LITERALS_JPX_DECODE for name in filters):
+        return data
+
+    width, height = img['srcsize']
+    bits = img['bits']
+    colorspace = resolve1(stream.get("ColorSpace"))
+    palette = None
+    if isinstance(colorspace, list) and literal_name(colorspace[0]) == "Indexed":
+        # [/Indexed 기본 색 공간 최대 인덱스 색상표]
+        palette = resolve1(colorspace[3])
+        palette = palette.get_data() if hasattr(palette, "get_data") else palette
+        if isinstance(palette, str):
+            palette = palette.encode("latin-1")
+        colorspace = resolve1(colorspace[1])
+    components = get_colorspace_components(colorspace)
+    mode = RAW_IMAGE_MODES.get(components)
+    if mode is None or bits not in (1, 2, 4, 8) or (bits != 8 and palette is None and mode != "L"):
+        raise Exception(f"지원하지 않는 이미지 형식입니다: 색 공간 {colorspace}, {bits}비트")
+
+    if palette is not None:
+        image = Image.frombytes("P", (width, height), data, "raw", "P" if bits == 8 else f"P;{bits}")
+        base = Image.frombytes(mode, (len(palette) // components, 1), palette).convert("RGB")
+        image.putpalette(base.tobytes())
+    else:
+        if bits == 1:
+            image = Image.frombytes("1", (width, height), data).convert("L")
+        elif bits != 8:
+            image = Image.frombytes("L", (width, height), data, "raw", f"L;{bits}")
+        else:
+            image = Image.frombytes(mode, (width, height), data)
+        if mode == "CMYK":
+            image = image.convert("RGB")  # 원시 CMYK는 Adobe JPEG처럼 반전되어 있지 않음
+        # /Decode [1 0 ...]은 값이 반전된 이미지 (흑백 스캔에서 흔함)
+        decode = resolve1(stream.get("Decode"))
+        if decode and [float(v) for v in decode] == [1.0, 0.0] * components:
+            image = ImageOps.invert(image)
+
+    output = io.BytesIO()
+    image.save(output, "PNG")
+    return output.getvalue()
+
+def get_colorspace_components(colorspace):
+    """
+    PDF 색 공간의 색 구성 요소 수를 반환하는 함수, 알 수 없으면 None.
+    """
+    if colorspace is None:
+        return None
+    if isinstance(colorspace, list):
+        if literal_name(colorspace[0]) == "ICCBased":
+            return resolve1(colorspace[1]).get("N")
+        colorspace = colorspace[0]  # [/CalRGB 속성] 등
+    return COLORSPACE_COMPONENTS.get(literal_name(colorspace))
+
+def transcode_image(image):
+    """
+    PNG로 저장할 수 있도록 이미지를 RGB로 변환하는 함수.
+    """
+    if image.mode == 'CMYK':
+        return ImageOps.invert(image.convert('RGB'))
+    return image.convert('RGB')
+
+def save_image_passthrough(image_bytes, image_folder):
+    """
+    이미지 데이터를 내용 해시 이름으로 저장하는 함수.
+    웹에서 바로 쓸 수 있는 형식은 디코딩 없이 원본 바이트를 그대로 쓰고,
+    CMYK JPEG이나 JPEG2000처럼 변환이 필요한 경우에만 PNG로 변환합니다.
+    같은 내용의 이미지는 이미 저장되어 있으면 다시 쓰지 않습니다.
+
+    :param image_bytes: 이미지 데이터
+    :param image_folder: 이미지를 저장할 폴더 경로
+    :return: 저장된 이미지 경로
+    """
+    digest = hashlib.sha256(image_bytes).hexdigest()[:16]
+    image = Image.open(io.BytesIO(image_bytes))  # 헤더만 읽으며 픽셀은 디코딩하지 않음
+    image_ext = PASSTHROUGH_FORMATS.get(image.format)
+    if image.format == "JPEG" and image.mode not in ("L", "RGB"):
+        image_ext = None  # CMYK JPEG은 브라우저 지원이 불안정하므로 변환
+
+    image_path = os.path.join(image_folder, f"{digest}.{image_ext or 'png'}")
+    if os.path.exists(image_path):
+        return image_path
+
+    # 다른 프로세스가 쓰는 중인 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체
+    fd, temp_path = tempfile.mkstemp(dir=image_folder, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            if image_ext:
+                f.write(image_bytes)
+            else:
+                transcode_image(image).save(f, "PNG")
+        os.replace(temp_path, image_path)
+    except Exception:
+        # 변환에 실패한 임시 파일이 이미지 폴더에 남지 않도록 삭제
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    return image_path
+
+def benchmark_engines(pdf_paths, engines=ENGINES):
+    """
+    같은 PDF 묶음에 대해 엔진별 변환 시간을 측정하는 함수.
+    이미지는 실행마다 만드는 임시 폴더에 저장하고 측정 후 삭제하므로 작업 폴더에 파일을 남기지 않습니다.
+
+    :param pdf_paths: 측정할 PDF 파일 경로 리스트
+    :param engines: 비교할 엔진 이름 리스트
+    :return: {엔진: {"seconds": 총 시간, "pages": 총 페이지 수}} 딕셔너리
+    """
+    results = {}
+    for engine in engines:
+        total_seconds = 0.0
+        total_pages = 0
+        for pdf_path in pdf_paths:
+            with fitz.open(pdf_path) as doc:
+                total_pages += len(doc)
+            with tempfile.TemporaryDirectory() as output_root:
+                start_time = time.perf_counter()
+                convert_pdf_to_markdown(pdf_path, engine=engine, output_root=output_root)
+                total_seconds += time.perf_counter() - start_time
+        results[engine] = {"seconds": total_seconds, "pages": total_pages}
+
+    for engine, result in results.items():
+        pages_per_second = result["pages"] / result["seconds"] if result["seconds"] else 0.0
+        print(f"{engine}: {result['pages']}페이지, {result['seconds']:.2f}초 ({pages_per_second:.1f} 페이지/초)")
+
+    return results
+
 def convert_text_to_markdown(text):
     """
     추출된 텍스트를 Markdown 형식으로 변환하는 함수.
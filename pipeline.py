@@ -0,0 +1,106 @@
+import os
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+# 이미 압축된 형식은 다시 압축하지 않고 그대로 저장
+STORED_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.jp2', '.jpx', '.gif', '.webp', '.pdf', '.pptx', '.zip')
+
+def run_pipeline(items, prepare, process, on_start=None, on_done=None, prefetch=1):
+    """
+    여러 항목을 2단계 파이프라인으로 처리하는 함수.
+    prepare 단계(파싱/렌더링)는 백그라운드 스레드에서 다음 항목을 미리 수행하고,
+    process 단계(OCR 등)는 호출한 스레드에서 순서대로 수행합니다.
+
+    :param items: 처리할 항목 리스트
+    :param prepare: prepare(item) -> 준비 결과, 백그라운드 스레드에서 호출
+    :param process: process(item, prepared) -> [(파일 경로, ZIP 내 경로), ...]
+    :param on_start: on_start(index, item), process 단계 시작 시 호출
+    :param on_done: on_done(index, result), 항목 처리 완료 시 호출
+    :param prefetch: 미리 준비해 둘 항목 수
+    :return: 항목별 결과 딕셔너리 리스트 (item, outputs, error, elapsed)
+    """
+    results = []
+    futures = {}
+    next_index = 0
+
+    with ThreadPoolExecutor(max_workers=max(1, prefetch)) as executor:
+        for i, item in enumerate(items):
+            # 현재 항목과 다음 prefetch개 항목의 준비 단계를 미리 제출
+            while next_index < len(items) and next_index <= i + prefetch:
+                futures[next_index] = executor.submit(prepare, items[next_index])
+                next_index += 1
+
+            result = {"item": item, "outputs": [], "error": None, "elapsed": 0.0}
+            start_time = time.perf_counter()
+            try:
+                prepared = futures.pop(i).result()
+                if on_start:
+                    on_start(i, item)
+                result["outputs"] = process(item, prepared) or []
+            except Exception as e:
+                print(f"항목 {i+1} 처리 중 오류 발생: {str(e)}")
+                result["error"] = str(e)
+            result["elapsed"] = time.perf_counter() - start_time
+
+            results.append(result)
+            if on_done:
+                on_done(i, result)
+
+    return results
+
+def write_results_zip(results, zip_path):
+    """
+    파이프라인 결과 파일을 하나의 ZIP 파일로 묶는 함수.
+    파일을 하나씩 디스크에서 읽어 기록하므로 전체 결과를 메모리에 올리지 않습니다.
+
+    :param results: run_pipeline의 반환값
+    :param zip_path: 저장할 ZIP 파일 경로
+    :return: 저장된 파일 수
+    """
+    file_count = 0
+    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
+        for result in results:
+            for path, arcname in result["outputs"]:
+                if not os.path.exists(path):
+                    continue
+                compress_type = zipfile.ZIP_STORED if path.lower().endswith(STORED_EXTENSIONS) else zipfile.ZIP_DEFLATED
+                zf.write(path, arcname, compress_type=compress_type)
+                file_count += 1
+    return file_count
+
+def iter_with_deadline(keys, handler, time_budget=None):
+    """
+    항목을 순서대로 처리하며 결과를 완료되는 대로 하나씩 내보내는 제너레이터.
+    마감 시간이 지났거나 남은 시간이 지금까지의 평균 처리 시간보다 짧으면 새 항목을 시작하지 않고,
+    남은 항목을 "pending" 상태로 내보낸 뒤 종료합니다.
+    항목 하나에서 발생한 예외는 해당 항목만 "error"로 기록하고 다음 항목을 계속 처리합니다.
+
+    :param keys: 처리할 항목 리스트 (예: 페이지 번호)
+    :param handler: handler(key) -> 결과
+    :param time_budget: 시간 예산(초), None이면 제한 없음
+    :return: {"key", "status"("done"/"error"/"pending"), "result", "error", "elapsed"} 딕셔너리 제너레이터
+    """
+    deadline = time.monotonic() + time_budget if time_budget is not None else None
+    total_elapsed = 0.0
+
+    for index, key in enumerate(keys):
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            average = total_elapsed / index if index else 0.0
+            if remaining <= 0 or average > remaining:
+                for pending_key in keys[index:]:
+                    yield {"key": pending_key, "status": "pending", "result": None, "error": None, "elapsed": 0.0}
+                return
+
+        start_time = time.monotonic()
+        try:
+            result = handler(key)
+            status, error = "done", None
+        except Exception as e:
+            print(f"항목 {key} 처리 중 오류 발생: {str(e)}")
+            result, status, error = None, "error", str(e)
+        elapsed = time.monotonic() - start_time
+        total_elapsed += elapsed
+
+        yield {"key": key, "status": status, "result": result, "error": error, "elapsed": elapsed}
@@ -0,0 +1,282 @@
+import os
+import json
+import time
+import socket
+import sqlite3
+import threading
+
+# 공유 마운트(NFS)에서는 WAL 모드의 공유 메모리가 동작하지 않으므로 기본 저널 모드를 사용하고,
+# 모든 작업을 짧은 트랜잭션으로 처리합니다. 노드 간 시계는 NTP로 맞춰져 있어야 합니다.
+DEFAULT_LEASE_SECONDS = 300
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_BACKOFF_SECONDS = 30
+MAX_BACKOFF_SECONDS = 3600
+
+def connect(db_path):
+    """
+    작업 큐 데이터베이스에 연결하는 함수
+
+    :param db_path: SQLite 파일 경로
+    :return: sqlite3.Connection (autocommit 모드)
+    """
+    conn = sqlite3.connect(db_path, timeout=60, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+def init_queue(db_path):
+    """
+    작업 큐 테이블을 생성하는 함수
+
+    :param db_path: SQLite 파일 경로
+    """
+    conn = connect(db_path)
+    try:
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                key TEXT NOT NULL UNIQUE,
+                payload TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                max_attempts INTEGER NOT NULL,
+                worker_id TEXT,
+                lease_expires REAL,
+                available_at REAL NOT NULL DEFAULT 0,
+                last_error TEXT,
+                updated_at REAL
+            )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, available_at)")
+    finally:
+        conn.close()
+
+def enqueue_job(db_path, key, payload, max_attempts=DEFAULT_MAX_ATTEMPTS):
+    """
+    작업을 큐에 추가하는 함수. 같은 key의 작업이 이미 있으면 추가하지 않습니다.
+
+    :param db_path: SQLite 파일 경로
+    :param key: 작업을 구분하는 고유 키 (예: 입력 파일 경로)
+    :param payload: 작업 처리 함수에 전달할 JSON 직렬화 가능한 딕셔너리
+    :param max_attempts: 최대 시도 횟수
+    :return: 새로 추가되었으면 True, 이미 있으면 False
+    """
+    conn = connect(db_path)
+    try:
+        cursor = conn.execute(
+            "INSERT OR IGNORE INTO jobs (key, payload, max_attempts, updated_at) VALUES (?, ?, ?, ?)",
+            (key, json.dumps(payload, ensure_ascii=False), max_attempts, time.time())
+        )
+        return cursor.rowcount == 1
+    finally:
+        conn.close()
+
+def claim_job(db_path, worker_id, lease_seconds=DEFAULT_LEASE_SECONDS):
+    """
+    처리할 작업 하나를 임대(lease)하는 함수
+    대기 중이면서 재시도 시각이 지난 작업이나 임대 기간이 만료된 작업을 가져옵니다.
+
+    :param db_path: SQLite 파일 경로
+    :param worker_id: 작업자 ID
+    :param lease_seconds: 임대 기간(초)
+    :return: 작업 딕셔너리 (id, key, payload, attempts), 없으면 None
+    """
+    conn = connect(db_path)
+    try:
+        now = time.time()
+        # 쓰기 잠금을 먼저 잡아 여러 작업자가 같은 작업을 가져가지 않도록 함
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # 임대가 만료된 작업 중 시도 횟수를 모두 쓴 작업은 실패 처리
+            conn.execute(
+                """UPDATE jobs SET status = 'failed', last_error = '임대 기간 만료', worker_id = NULL, updated_at = ?
+                   WHERE status = 'running' AND lease_expires < ? AND attempts >= max_attempts""",
+                (now, now)
+            )
+            row = conn.execute(
+                """SELECT id, key, payload, attempts FROM jobs
+                   WHERE (status = 'pending' AND available_at <= ?)
+                      OR (status = 'running' AND lease_expires < ?)
+                   ORDER BY available_at, id LIMIT 1""",
+                (now, now)
+            ).fetchone()
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+            conn.execute(
+                """UPDATE jobs SET status = 'running', worker_id = ?, lease_expires = ?,
+                   attempts = attempts + 1, updated_at = ? WHERE id = ?""",
+                (worker_id, now + lease_seconds, now, row["id"])
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return {"id": row["id"], "key": row["key"], "payload": json.loads(row["payload"]), "attempts": row["attempts"] + 1}
+    finally:
+        conn.close()
+
+def renew_lease(db_path, job_id, worker_id, lease_seconds=DEFAULT_LEASE_SECONDS):
+    """
+    작업 임대 기간을 연장하는 함수 (하트비트)
+
+    :return: 연장 성공 시 True, 임대를 잃었으면 False
+    """
+    conn = connect(db_path)
+    try:
+        now = time.time()
+        cursor = conn.execute(
+            """UPDATE jobs SET lease_expires = ?, updated_at = ?
+               WHERE id = ? AND worker_id = ? AND status = 'running'""",
+            (now + lease_seconds, now, job_id, worker_id)
+        )
+        return cursor.rowcount == 1
+    finally:
+        conn.close()
+
+def complete_job(db_path, job_id, worker_id):
+    """
+    작업을 완료 처리하는 함수
+
+    :return: 성공 시 True, 임대를 잃어 다른 작업자가 가져갔으면 False
+    """
+    conn = connect(db_path)
+    try:
+        cursor = conn.execute(
+            """UPDATE jobs SET status = 'done', lease_expires = NULL, last_error = NULL, updated_at = ?
+               WHERE id = ? AND worker_id = ? AND status = 'running'""",
+            (time.time(), job_id, worker_id)
+        )
+        return cursor.rowcount == 1
+    finally:
+        conn.close()
+
+def fail_job(db_path, job_id, worker_id, error, backoff_seconds=DEFAULT_BACKOFF_SECONDS):
+    """
+    작업 실패를 기록하는 함수
+    시도 횟수가 남아 있으면 지수 백오프 후 다시 대기 상태로 돌리고, 아니면 실패 처리합니다.
+
+    :param error: 오류 메시지
+    :param backoff_seconds: 첫 재시도까지 대기 시간(초), 재시도마다 두 배로 증가
+    :return: 재시도 예정이면 True, 최종 실패면 False
+    """
+    conn = connect(db_path)
+    try:
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT attempts, max_attempts FROM jobs WHERE id = ? AND worker_id = ? AND status = 'running'",
+                (job_id, worker_id)
+            ).fetchone()
+            if row is None:
+                conn.execute("COMMIT")
+                return False
+            retry = row["attempts"] < row["max_attempts"]
+            delay = min(backoff_seconds * 2 ** (row["attempts"] - 1), MAX_BACKOFF_SECONDS)
+            conn.execute(
+                """UPDATE jobs SET status = ?, worker_id = NULL, lease_expires = NULL,
+                   available_at = ?, last_error = ?, updated_at = ? WHERE id = ?""",
+                ("pending" if retry else "failed", now + delay, error, now, job_id)
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return retry
+    finally:
+        conn.close()
+
+def queue_status(db_path):
+    """
+    상태별 작업 수를 반환하는 함수
+
+    :return: {상태: 작업 수} 딕셔너리
+    """
+    conn = connect(db_path)
+    try:
+        rows = conn.execute("SELECT status, COUNT(*) AS count FROM jobs GROUP BY status").fetchall()
+        return {row["status"]: row["count"] for row in rows}
+    finally:
+        conn.close()
+
+def run_worker(db_path, handler, worker_id=None, lease_seconds=DEFAULT_LEASE_SECONDS,
+               backoff_seconds=DEFAULT_BACKOFF_SECONDS, poll_interval=5, stop_when_empty=True):
+    """
+    큐가 빌 때까지 작업을 가져와 처리하는 작업자 함수
+    작업을 처리하는 동안 백그라운드 스레드가 임대 기간의 1/3마다 하트비트로 임대를 연장하고,
+    다른 작업자에게 임대가 넘어갔거나 연장하지 못한 채 임대 기간이 지나면
+    handler에 전달한 lease_lost 이벤트를 설정해 처리를 멈출 수 있게 합니다.
+
+    :param db_path: SQLite 파일 경로
+    :param handler: handler(payload, lease_lost), 실패 시 예외를 발생시켜야 함.
+                    lease_lost(threading.Event)가 설정되면 결과를 쓰지 말고 중단해야 함
+    :param worker_id: 작업자 ID, None이면 "호스트명:PID"
+    :param lease_seconds: 임대 기간(초)
+    :param backoff_seconds: 첫 재시도까지 대기 시간(초)
+    :param poll_interval: 가져올 작업이 없을 때 다시 확인하기까지 대기 시간(초)
+    :param stop_when_empty: True면 대기/실행 중인 작업이 모두 없어졌을 때 종료
+    :return: {"done": 완료 수, "failed": 실패 수}
+    """
+    if worker_id is None:
+        worker_id = f"{socket.gethostname()}:{os.getpid()}"
+    counts = {"done": 0, "failed": 0}
+
+    while True:
+        claimed_at = time.time()
+        job = claim_job(db_path, worker_id, lease_seconds)
+        if job is None:
+            status = queue_status(db_path)
+            if stop_when_empty and not status.get("pending") and not status.get("running"):
+                break
+            # 다른 작업자가 처리 중이거나 재시도 대기 중인 작업이 있으면 기다림
+            time.sleep(poll_interval)
+            continue
+
+        print(f"[{worker_id}] 작업 {job['id']} 시작 (시도 {job['attempts']}): {job['key']}")
+        stop_heartbeat = threading.Event()
+        lease_lost = threading.Event()
+
+        def heartbeat(job_id=job["id"], lease_lost=lease_lost, lease_expires=claimed_at + lease_seconds):
+            while not stop_heartbeat.wait(lease_seconds / 3):
+                renew_started = time.time()
+                try:
+                    renewed = renew_lease(db_path, job_id, worker_id, lease_seconds)
+                except sqlite3.Error as e:
+                    # 공유 마운트에서 잠금 대기 시간 초과 등은 일시적일 수 있으므로 다음 주기에 다시 시도
+                    print(f"[{worker_id}] 작업 {job_id}의 임대 연장 중 오류 발생: {str(e)}")
+                    if time.time() < lease_expires:
+                        continue
+                    renewed = False
+                if renewed:
+                    lease_expires = renew_started + lease_seconds
+                    continue
+                print(f"[{worker_id}] 작업 {job_id}의 임대를 잃었습니다.")
+                lease_lost.set()
+                break
+
+        heartbeat_thread = threading.Thread(target=heartbeat, daemon=True)
+        heartbeat_thread.start()
+        try:
+            handler(job["payload"], lease_lost)
+        except Exception as e:
+            stop_heartbeat.set()
+            heartbeat_thread.join()
+            if lease_lost.is_set():
+                # 다른 작업자가 이미 가져간 작업이므로 실패로 기록하지 않음
+                print(f"[{worker_id}] 작업 {job['id']}의 임대를 잃어 처리를 중단했습니다: {str(e)}")
+                continue
+            retry = fail_job(db_path, job["id"], worker_id, str(e), backoff_seconds)
+            counts["failed"] += 1
+            print(f"[{worker_id}] 작업 {job['id']} 처리 중 오류 발생: {str(e)} ({'재시도 예정' if retry else '최종 실패'})")
+            continue
+
+        stop_heartbeat.set()
+        heartbeat_thread.join()
+        if complete_job(db_path, job["id"], worker_id):
+            counts["done"] += 1
+            print(f"[{worker_id}] 작업 {job['id']} 완료: {job['key']}")
+        else:
+            print(f"[{worker_id}] 작업 {job['id']}의 임대가 만료되어 완료를 기록하지 못했습니다.")
+
+    print(f"[{worker_id}] 작업자 종료: 완료 {counts['done']}개, 실패 {counts['failed']}개")
+    return counts